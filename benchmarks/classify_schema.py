@@ -0,0 +1,65 @@
+"""
+Time and memory to classify every class of a large schema, 500 local classes in a binary tree, then again from the
+classification cache. Memory is what tracemalloc sees retained after classifying, and at its peak while doing it.
+
+    python benchmarks/classify_schema.py
+"""
+import gc
+import importlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.large_schema import MODULE_NAME, write_schema_module
+from codespeak.helpers.parsed_source_file import invalidate_parsed_source_file
+from codespeak.settings import settings
+from codespeak.type_definitions import classify
+
+CLASSES = 500
+
+
+def classify_all(classes):
+    return [classify.from_any(_class) for _class in classes]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as project:
+        write_schema_module(project, CLASSES)
+        sys.path.insert(0, project)
+        settings.set_abspath_to_project_root(project)
+        models = importlib.import_module(MODULE_NAME)
+        classes = [getattr(models, f"C{i}") for i in range(CLASSES)]
+        # built once per process either way, so it's left out
+        classify.get_installed_packages()
+
+        started = time.perf_counter()
+        nodes = [classify.node_from_any(_class) for _class in classes]
+        classified = time.perf_counter() - started
+        definitions = [node.to_type_definition() for node in nodes]
+        built = time.perf_counter() - started
+
+        started = time.perf_counter()
+        classify_all(classes)
+        cached = time.perf_counter() - started
+
+        # again from scratch for memory, tracemalloc slows everything down too much to time under it
+        del nodes, definitions
+        classify.clear_classification_cache()
+        invalidate_parsed_source_file(models.__file__)
+        gc.collect()
+        tracemalloc.start()
+        nodes = [classify.node_from_any(_class) for _class in classes]
+        gc.collect()
+        nodes_retained = tracemalloc.get_traced_memory()[0]
+        definitions = [node.to_type_definition() for node in nodes]
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"classify {CLASSES} classes          {classified * 1000:8.1f} ms, {nodes_retained / 1e6:6.2f} MB retained")
+    print(f"  and build their definitions   {built * 1000:8.1f} ms, {retained / 1e6:6.2f} MB retained, {peak / 1e6:6.2f} MB peak")
+    print(f"again, from the cache           {cached * 1000:8.2f} ms")
@@ -0,0 +1,94 @@
+"""
+Import latency regression benchmark, based on `python -X importtime`.
+
+Each scenario runs in a fresh interpreter, several times, and reports the best cumulative
+import time of the codespeak package plus any heavy dependency that got loaded. Exits
+non-zero if a scenario loads a dependency it shouldn't, or is slower than its budget.
+
+    python benchmarks/import_time.py
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Set
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_DEPENDENCIES = ["libcst", "httpx", "requests", "furl", "astor", "pydantic"]
+RUNS = 5
+# modules the interpreter imports on its own at startup, not charged to any scenario
+STARTUP_MODULES: Set[str] = set()
+
+
+class Scenario(NamedTuple):
+    name: str
+    statement: str
+    # heavy dependencies this scenario is allowed to load
+    allowed: List[str]
+    # best cumulative microseconds allowed for everything the statement imports
+    budget_us: int
+
+
+SCENARIOS = [
+    Scenario("import codespeak", "import codespeak", [], 20_000),
+    Scenario(
+        "codespeak.get",
+        "import codespeak; codespeak.get",
+        ["requests", "pydantic"],
+        400_000,
+    ),
+    Scenario(
+        "codespeak.aget",
+        "import codespeak; codespeak.aget",
+        ["httpx", "requests", "pydantic"],
+        600_000,
+    ),
+    Scenario(
+        "codespeak.writable",
+        "import codespeak; codespeak.writable",
+        ["pydantic", "requests"],
+        600_000,
+    ),
+]
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds for each module, plus "__total__" for everything the statement imported"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        # codespeak is imported from this checkout wherever the script is run from
+        cwd=REPO_ROOT,
+    )
+    times = {"__total__": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+        # nested imports are indented, outermost ones already include them
+        is_outermost = not name[1:].startswith(" ")
+        if is_outermost and name.strip() not in STARTUP_MODULES:
+            times["__total__"] += int(cumulative)
+    return times
+
+
+def run_scenario(scenario: Scenario) -> bool:
+    runs = [import_times(scenario.statement) for _ in range(RUNS)]
+    best = min(times["__total__"] for times in runs)
+    loaded = [dep for dep in HEAVY_DEPENDENCIES if dep in runs[0]]
+    unexpected = [dep for dep in loaded if dep not in scenario.allowed]
+    ok = not unexpected and best <= scenario.budget_us
+    print(
+        f"{'ok  ' if ok else 'FAIL'} {scenario.name:<22} {best / 1000:8.1f} ms"
+        f" (budget {scenario.budget_us / 1000:.0f} ms)  loads: {', '.join(loaded) or '-'}"
+        + (f"  unexpected: {', '.join(unexpected)}" if unexpected else "")
+    )
+    return ok
+
+
+if __name__ == "__main__":
+    STARTUP_MODULES.update(import_times("pass"))
+    results = [run_scenario(scenario) for scenario in SCENARIOS]
+    sys.exit(0 if all(results) else 1)
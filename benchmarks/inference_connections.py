@@ -0,0 +1,72 @@
+"""
+Per-request latency of sequential inferences against a local stand-in for the inference service, with the pooled
+client against a new client for every request.
+
+A new client means a new connection, and a new TLS handshake against the real service, for every inference.
+
+    python benchmarks/inference_connections.py
+"""
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.local_server import JsonHandler, start_server
+from codespeak.function.function_declaration_lite import FunctionDeclarationLite
+from codespeak.function.function_lite import FunctionLite
+from codespeak.inference import codespeak_service
+
+REQUESTS = 200
+
+FUNCTION_LITE = FunctionLite(
+    declaration=FunctionDeclarationLite(
+        name="add",
+        qualname="add",
+        module_name="benchmarks.example",
+        docstring="adds a and b",
+        source_code='def add(a: int, b: int) -> int:\n    """adds a and b"""\n    pass\n',
+        signature_text="def add(a: int, b: int) -> int:",
+        imports_text="",
+        query_document="",
+        incomplete_file="",
+        is_method=False,
+        return_types=[],
+        params=[],
+    ),
+    custom_types={},
+)
+
+
+class InferenceHandler(JsonHandler):
+    def do_POST(self):
+        self.read_body()
+        self.send_bytes(
+            b"```python\ndef add(a: int, b: int) -> int:\n    return a + b\n```",
+            content_type="text/plain",
+        )
+
+
+async def run_inferences(new_client_per_request: bool):
+    for _ in range(REQUESTS):
+        await codespeak_service.make_inference(FUNCTION_LITE, "harmonic")
+        if new_client_per_request:
+            await codespeak_service.close_client()
+    await codespeak_service.close_client()
+
+
+def ms_per_request(new_client_per_request: bool) -> float:
+    # make_inference echoes the response as it streams
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        asyncio.run(run_inferences(new_client_per_request))
+    return (time.perf_counter() - started) / REQUESTS * 1000
+
+
+if __name__ == "__main__":
+    codespeak_service.url = start_server(InferenceHandler)
+    print(f"new client per request  {ms_per_request(True):6.2f} ms/request")
+    print(f"pooled client           {ms_per_request(False):6.2f} ms/request")
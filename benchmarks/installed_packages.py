@@ -0,0 +1,40 @@
+"""
+Cost of checking whether a module belongs to an installed package, which classify does for every class it sees.
+
+The index of installed packages is built once, so only the first check pays for reading package metadata.
+Classification is timed uncached, so every call goes through the check.
+
+    python benchmarks/installed_packages.py
+"""
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from codespeak.type_definitions import classify
+
+NUMBER = 2000
+
+
+def best_us_per_call(func) -> float:
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER * 1e6
+
+
+if __name__ == "__main__":
+    classify.invalidate_installed_packages()
+    started = time.perf_counter()
+    classify.is_installed_package_type("httpx")
+    first_call = time.perf_counter() - started
+
+    print(f"first check, builds the index        {first_call * 1000:8.2f} ms")
+    print(
+        f"is_installed_package_type            {best_us_per_call(lambda: classify.is_installed_package_type('httpx._client')):8.2f} us/call"
+    )
+    print(
+        f"classify httpx.Client, uncached      {best_us_per_call(lambda: classify.node_from_any_uncached(httpx.Client)):8.2f} us/call"
+    )
@@ -0,0 +1,43 @@
+"""Writes a module with a large tree of local classes, for benchmarks that classify a big schema"""
+import os
+from typing import List
+
+MODULE_NAME = "large_schema_models"
+
+HEADER = """\
+from typing import Dict, List, Optional
+import datetime
+
+
+class Shared:
+    value: int
+"""
+
+
+def class_source(index: int, classes: int) -> str:
+    # a binary tree: C{i} holds a list of C{2i+1} and a dict of C{2i+2}, and every seventh class also inherits from its first child
+    first, second = 2 * index + 1, 2 * index + 2
+    bases = f"(C{first})" if index % 7 == 3 and first < classes else ""
+    lines = [
+        f"class C{index}{bases}:",
+        f"    id_{index}: int",
+        f"    created_{index}: datetime.datetime",
+        f"    shared_{index}: Optional[Shared]",
+    ]
+    if first < classes:
+        lines.append(f"    child_{index}_0: List[C{first}]")
+    if second < classes:
+        lines.append(f"    child_{index}_1: Optional[Dict[str, C{second}]]")
+    return "\n".join(lines) + "\n"
+
+
+def write_schema_module(directory: str, classes: int = 500) -> str:
+    """Writes the module, with every class sharing Shared and C0 at the root, and returns its path"""
+    sources: List[str] = [HEADER]
+    # children first, so every annotation refers to a class that's already defined
+    for index in reversed(range(classes)):
+        sources.append(class_source(index, classes))
+    path = os.path.join(directory, MODULE_NAME + ".py")
+    with open(path, "w") as f:
+        f.write("\n\n".join(sources))
+    return path
@@ -0,0 +1,36 @@
+"""A local HTTP server on a free port, run in a background thread, for benchmarks that shouldn't depend on the network"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Type
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    # keep-alive, so reusing connections is possible at all
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def send_bytes(self, body: bytes, content_type: str = "application/json"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, value: Any):
+        self.send_bytes(json.dumps(value).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(handler: Type[BaseHTTPRequestHandler]) -> str:
+    """Starts serving with handler and returns the server's base url. The thread is a daemon, so it ends with the process."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
@@ -0,0 +1,33 @@
+"""
+Time to build a request url from a path template and its params, with furl on every call against a template
+compiled once.
+
+    python benchmarks/path_template.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codespeak.public.rest_requests.path_template import (
+    build_url_with_path_params,
+    compile_path_template,
+)
+
+NUMBER = 20000
+BASE_URL = "https://api.harmonic.ai"
+PATH = "/companies/{id}/people/{person}"
+PATH_PARAMS = {"id": 12345, "person": "abc-def"}
+
+
+def best_us_per_url(func) -> float:
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER * 1e6
+
+
+if __name__ == "__main__":
+    furl = best_us_per_url(lambda: build_url_with_path_params(BASE_URL, PATH, PATH_PARAMS))
+    compiled = best_us_per_url(lambda: compile_path_template(BASE_URL, PATH).build(PATH_PARAMS))
+    print(f"furl per call       {furl:6.2f} us/url")
+    print(f"compiled template   {compiled:6.2f} us/url")
@@ -0,0 +1,38 @@
+"""
+Per-call overhead of @writable, in prod and dev, against the same function undecorated.
+
+    python benchmarks/prod_call_overhead.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codespeak.decorate.writable import writable
+from codespeak.settings import settings
+
+NUMBER = 1_000_000
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def best_ns_per_call(func) -> float:
+    timer = timeit.Timer("func(1, 2)", globals={"func": func})
+    return min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER * 1e9
+
+
+if __name__ == "__main__":
+    settings.set_environment("prod")
+    prod = writable(add)
+    settings.set_environment("dev")
+    dev = writable(add)
+
+    baseline = best_ns_per_call(add)
+    print(f"undecorated      {baseline:6.1f} ns/call")
+    print(f"@writable, prod  {best_ns_per_call(prod):6.1f} ns/call")
+    print(f"@writable, dev   {best_ns_per_call(dev):6.1f} ns/call  (written function)")
+    # prod must not add anything, it's the function itself
+    sys.exit(0 if prod is add else 1)
@@ -0,0 +1,51 @@
+"""
+Throughput of codespeak.get against a local server, with its keep-alive session per thread, next to requests.get,
+which opens a new connection for every call.
+
+    python benchmarks/rest_throughput.py
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import codespeak
+from benchmarks.local_server import JsonHandler, start_server
+from codespeak.apis.api_metadata import api_metadatas
+from codespeak.public.rest_requests.rest_request_helpers import close_sessions
+
+REQUESTS = 500
+THREADS = 8
+
+
+class ThingsHandler(JsonHandler):
+    def do_GET(self):
+        self.send_json({"path": self.path, "items": [{"id": i} for i in range(3)]})
+
+
+def requests_per_second(get_thing, threads: int = 1) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(get_thing, range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    base_url = start_server(ThingsHandler)
+    api_metadatas["local"] = {"base_url": base_url, "auth_style": 0}
+    codespeak.add_api("local", "key")
+
+    def with_codespeak(i: int):
+        return codespeak.get("local", "/things/{id}", path_params={"id": i})
+
+    def with_new_connection(i: int):
+        return requests.get(f"{base_url}/things/{i}").json()
+
+    print(f"requests.get, 1 thread         {requests_per_second(with_new_connection):8.0f} req/s")
+    print(f"codespeak.get, 1 thread        {requests_per_second(with_codespeak):8.0f} req/s")
+    print(f"codespeak.get, {THREADS} threads       {requests_per_second(with_codespeak, THREADS):8.0f} req/s")
+    close_sessions()
@@ -1,15 +1,97 @@
-from .function import WritableFunction
-from .settings.settings import (
-    set_verbose,
-    set_environment,
-    add_api,
-    set_interactive_mode,
-    remove_api,
-)
-from .public.dot_get import dot_get
-from .public.rest_requests.get import get
-from .public.rest_requests.post import post
-from .public.rest_requests.put import put
-from .public.rest_requests.delete import delete
-from .public.inferred_exception import InferredException
-from .decorate.writable import writable
+import importlib
+from typing import TYPE_CHECKING
+
+# public name -> module defining it. Modules are imported on first access, so
+# `import codespeak` doesn't load libcst, httpx, requests and the rest until they're used.
+_lazy_attributes = {
+    "WritableFunction": ".function",
+    "set_verbose": ".settings.settings",
+    "set_environment": ".settings.settings",
+    "add_api": ".settings.settings",
+    "set_interactive_mode": ".settings.settings",
+    "remove_api": ".settings.settings",
+    "set_use_inference_cache": ".settings.settings",
+    "dot_get": ".public.dot_get",
+    "dot_get_many": ".public.dot_get",
+    "get": ".public.rest_requests.get",
+    "post": ".public.rest_requests.post",
+    "put": ".public.rest_requests.put",
+    "delete": ".public.rest_requests.delete",
+    "stream_get": ".public.rest_requests.stream_get",
+    "paginate": ".public.rest_requests.paginate",
+    "aget": ".public.rest_requests.aget",
+    "apost": ".public.rest_requests.apost",
+    "aput": ".public.rest_requests.aput",
+    "adelete": ".public.rest_requests.adelete",
+    "enable_response_cache": ".public.rest_requests.response_cache",
+    "disable_response_cache": ".public.rest_requests.response_cache",
+    "response_cache_stats": ".public.rest_requests.response_cache",
+    "batch_get": ".public.rest_requests.batch",
+    "batch_post": ".public.rest_requests.batch",
+    "batch_put": ".public.rest_requests.batch",
+    "batch_delete": ".public.rest_requests.batch",
+    "InferredException": ".public.inferred_exception",
+    "writable": ".decorate.writable",
+    "write_all": ".decorate.write_all",
+    "regenerate": ".decorate.regenerate",
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name: str):
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        # subpackages like codespeak.settings used to be loaded by the eager imports
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # cached on the package, so later lookups don't come back through here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+
+if TYPE_CHECKING:
+    from .function import WritableFunction
+    from .settings.settings import (
+        set_verbose,
+        set_environment,
+        add_api,
+        set_interactive_mode,
+        remove_api,
+        set_use_inference_cache,
+    )
+    from .public.dot_get import dot_get, dot_get_many
+    from .public.rest_requests.get import get
+    from .public.rest_requests.post import post
+    from .public.rest_requests.put import put
+    from .public.rest_requests.delete import delete
+    from .public.rest_requests.stream_get import stream_get
+    from .public.rest_requests.paginate import paginate
+    from .public.rest_requests.aget import aget
+    from .public.rest_requests.apost import apost
+    from .public.rest_requests.aput import aput
+    from .public.rest_requests.adelete import adelete
+    from .public.rest_requests.response_cache import (
+        enable_response_cache,
+        disable_response_cache,
+        response_cache_stats,
+    )
+    from .public.rest_requests.batch import (
+        batch_get,
+        batch_post,
+        batch_put,
+        batch_delete,
+    )
+    from .public.inferred_exception import InferredException
+    from .decorate.writable import writable
+    from .decorate.write_all import write_all
+    from .decorate.regenerate import regenerate
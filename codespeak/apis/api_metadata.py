@@ -1,11 +1,36 @@
-from typing import Any, Callable, Dict, TypedDict
+from typing import Any, Callable, Dict, Literal, TypedDict
 
 
-class APIMetadata(TypedDict):
+class PaginationMetadata(TypedDict, total=False):
+    """How an api splits list responses into pages, used by codespeak.paginate"""
+
+    style: Literal["cursor", "offset"]
+    # dot path to the list of items in each page, the page itself is the list when missing
+    items_path: str
+    # cursor style: query param the cursor is sent in, and dot path to the next cursor in a page
+    cursor_param: str
+    next_cursor_path: str
+    # offset style: query params for the offset and page size
+    offset_param: str
+    limit_param: str
+    page_size: int
+    # offset style, optional: dot paths to the total number of items, and to a next link that's empty on the last page.
+    # Without either, pages are fetched until one is empty
+    total_path: str
+    next_path: str
+
+
+class RequiredAPIMetadata(TypedDict):
     base_url: str
     auth_style: int
 
 
+class APIMetadata(RequiredAPIMetadata, total=False):
+    # client-side cap used by the batch helpers, unlimited when missing
+    requests_per_second: float
+    pagination: PaginationMetadata
+
+
 api_metadatas: Dict[str, APIMetadata] = {
     "harmonic": {"base_url": "https://api.harmonic.ai", "auth_style": 0}
 }
@@ -0,0 +1,110 @@
+import os
+from types import ModuleType
+from typing import Callable, List, Set
+from codespeak.decorate.writable import get_source_file, should_write_function
+from codespeak.decorate.write_all import (
+    find_writable_functions,
+    load_module_from_file,
+    load_modules,
+    write_functions,
+)
+from codespeak.function.dependency_index import (
+    DependencyIndex,
+    FunctionKey,
+    function_key,
+    mark_stale_functions,
+)
+from codespeak.function.function_metadata import (
+    has_changed,
+    has_declaration_changed,
+    is_written_source_unchanged,
+    load_function_metadata,
+    source_files_with_metadata,
+)
+from codespeak.function.writable_function import WritableFunction
+from codespeak.helpers.auto_detect_abspath_to_project_root import (
+    auto_detect_abspath_to_project_root,
+)
+from codespeak.helpers.guarantee_abspath_to_root_exists import (
+    guarantee_abspath_to_project_root_exists,
+)
+from codespeak.inference.inference_scheduler import DEFAULT_MAX_CONCURRENCY
+from codespeak.settings import settings
+
+
+def regenerate(
+    module_or_path: ModuleType | str | None = None,
+    changed_only: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[str]:
+    """
+    Re-infers generated functions, by default only the ones whose declaration or custom types changed since they were written.
+
+    Stubs are always written. Functions with no metadata in _codespeak/ weren't generated by codespeak, so they're left alone.
+    A change to a local class marks only the functions that depend on it stale, and unchanged functions are skipped without being classified.
+
+    Args:
+        module_or_path (ModuleType | str | None, optional): Same as write_all. Defaults to every source file with metadata in the project.
+        changed_only (bool, optional): When False, every generated function is re-inferred. Defaults to True.
+        max_concurrency (int, optional): The most inferences to run at once. Defaults to 16.
+
+    Returns:
+        List[str]: the import paths of the functions that were written.
+    """
+    if module_or_path is None:
+        modules = load_modules_with_metadata()
+    else:
+        modules = load_modules(module_or_path)
+        if len(modules) > 0:
+            # metadata is found from the project root, which otherwise isn't set until something is classified
+            guarantee_abspath_to_project_root_exists(modules[0])
+    index = DependencyIndex.from_metadata()
+    located = index.located_classes()
+    stale = index.stale_functions(located)
+    mark_stale_functions(stale)
+    unverifiable = index.unverifiable_functions(located)
+    writable_functions = [
+        WritableFunction(func)
+        for func in find_writable_functions(modules)
+        if should_regenerate(func, changed_only, stale, unverifiable)
+    ]
+    return write_functions(writable_functions, max_concurrency=max_concurrency)
+
+
+def should_regenerate(
+    func: Callable,
+    changed_only: bool,
+    stale: Set[FunctionKey],
+    unverifiable: Set[FunctionKey],
+) -> bool:
+    if should_write_function(func.__wrapped__):
+        return True
+    source_file = get_source_file(func.__wrapped__)
+    metadata = load_function_metadata(source_file, func.__qualname__)
+    if metadata is None:
+        return False
+    if not changed_only or metadata.stale:
+        return True
+    key = function_key(source_file, func.__qualname__)
+    if key in stale:
+        return True
+    if key in unverifiable:
+        return has_changed(WritableFunction(func).to_function_lite(), metadata)
+    if is_written_source_unchanged(source_file, func.__qualname__, metadata):
+        # the declaration reads as it was written, and the classes it uses are unchanged, so it isn't classified at all
+        return False
+    # edited since it was written. The index already checked its classes, so only the declaration matters
+    return has_declaration_changed(WritableFunction(func).to_function_lite(), metadata)
+
+
+def load_modules_with_metadata() -> List[ModuleType]:
+    if not settings.get_abspath_to_project_root():
+        settings.set_abspath_to_project_root(
+            auto_detect_abspath_to_project_root(os.getcwd())
+        )
+    return [
+        load_module_from_file(source_file)
+        for source_file in source_files_with_metadata()
+        # deleted since it was generated
+        if os.path.exists(source_file)
+    ]
@@ -1,29 +1,30 @@
 from functools import wraps
+import dis
 import inspect
-from typing import Any, Callable, Dict, List, Tuple, TypeVar
-from functools import wraps
-from codespeak.function.function_declaration import (
-    FunctionDeclaration,
-)
-from codespeak.function.writable_function import WritableFunction
+from types import CodeType
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, TypeVar
 from codespeak.settings import settings
 from codespeak.settings.environment import Environment
 from codespeak.function.function_attributes import FunctionAttributes
-from codespeak.frame_tests import FrameTests
-from codespeak.frame import Frame
-from codespeak.helpers.get_definitions_from_function_object import (
-    get_definitions_from_function_object,
+from codespeak.helpers.parsed_source_file import (
+    source_file_version,
+    try_get_parsed_source_file_for_function,
 )
 from codespeak.settings.settings import Environment
 
 
 def writable(func):
+    # decided once, at decoration time. In prod the function is returned as is, so calls have no overhead
+    if settings.get_environment() == Environment.PROD:
+        return func
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if wrapper._is_dev:  # type: ignore
-            if should_write_function(func):
-                writable_function = WritableFunction(wrapper)
-                return writable_function._write(get_source_file(func))
+        if should_write_wrapped_function(wrapper, func):
+            from codespeak.function.writable_function import WritableFunction
+
+            writable_function = WritableFunction(wrapper)
+            return writable_function._write(get_source_file(func))
         return func(*args, **kwargs)
 
     _assign_default_function_attributes(wrapper, func)
@@ -38,62 +39,126 @@ def get_source_file(function: Callable) -> str:
     return ff
 
 
-import libcst as cst
-from libcst import MaybeSentinel, RemovalSentinel
-from libcst.metadata import ProviderT, ExpressionContextProvider, ExpressionContext
-
-
-class ShouldWriteVisitor(cst.CSTVisitor):
-    def __init__(self) -> None:
-        self.should_write = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-        body = node.body.body
-        docstring = node.get_docstring(clean=True)
-
-        # Remove the leading docstring if it exists
-        if docstring is not None:
-            body = body[1:]
-
-        # Check if the function only contains a 'pass' statement now
-        if len(body) == 1 and isinstance(body[0], cst.SimpleStatementLine):
-            first_statement = body[0]
-            if len(first_statement.body) == 1 and isinstance(
-                first_statement.body[0], cst.Pass
-            ):
-                self.should_write = True
+# opcodes that show up in any function body, including one that's just `pass`
+STUB_PREAMBLE_OPNAMES = {
+    "RESUME",
+    "NOP",
+    "CACHE",
+    "EXTENDED_ARG",
+    "MAKE_CELL",
+    "COPY_FREE_VARS",
+    "RETURN_GENERATOR",
+    "POP_TOP",
+}
+
+
+def may_be_stub(code: CodeType) -> bool:
+    """Cheap bytecode check. A body of only `pass` (and a docstring) compiles to `return None`, so anything else is already written."""
+    instructions = [
+        instruction
+        for instruction in dis.get_instructions(code)
+        if instruction.opname not in STUB_PREAMBLE_OPNAMES
+    ]
+    if len(instructions) == 1:
+        return (
+            instructions[0].opname == "RETURN_CONST" and instructions[0].argval is None
+        )
+    if len(instructions) == 2:
+        return (
+            instructions[0].opname == "LOAD_CONST"
+            and instructions[0].argval is None
+            and instructions[1].opname == "RETURN_VALUE"
+        )
+    return False
+
+
+class ShouldWriteVerdict(NamedTuple):
+    code: CodeType
+    # None when the bytecode alone decided, otherwise the source file version the verdict was read from
+    source_file_version: Tuple[int, int] | None
+    should_write: bool
+
+
+def should_write_wrapped_function(wrapper: Callable, func: Callable) -> bool:
+    """should_write_function, with its verdict cached on the wrapper until the function's code or source file changes"""
+    code = func.__code__
+    verdict: ShouldWriteVerdict | None = getattr(
+        wrapper, FunctionAttributes.should_write, None
+    )
+    if verdict is not None and verdict.code is code:
+        if verdict.source_file_version is None:
+            return verdict.should_write
+        if verdict.source_file_version == source_file_version(code.co_filename):
+            return verdict.should_write
+    if not may_be_stub(code):
+        verdict = ShouldWriteVerdict(
+            code=code, source_file_version=None, should_write=False
+        )
+    else:
+        verdict = ShouldWriteVerdict(
+            code=code,
+            source_file_version=source_file_version(code.co_filename),
+            should_write=should_write_function(func),
+        )
+    setattr(wrapper, FunctionAttributes.should_write, verdict)
+    return verdict.should_write
 
 
 def should_write_function(func: Callable) -> bool:
-    source = inspect.getsource(func)
-    module = cst.parse_module(source)
+    if not may_be_stub(func.__code__):
+        return False
+    # libcst is only needed once a function looks like a stub, so it's loaded here
+    import libcst as cst
+    from codespeak.helpers.should_write_visitor import ShouldWriteVisitor
+
+    parsed = try_get_parsed_source_file_for_function(func)
+    if parsed is None:
+        node = cst.parse_module(inspect.getsource(func))
+    else:
+        node = parsed.cst_function(func.__qualname__)
     visitor = ShouldWriteVisitor()
-    module.visit(visitor)
+    node.visit(visitor)
     return visitor.should_write
 
 
 def _assign_default_function_attributes(wrapper: Callable, decorated_func: Callable):
-    env = settings.get_environment()
-    setattr(wrapper, FunctionAttributes.is_dev, env != Environment.PROD)
-    if env == Environment.DEV:
-        function_definitions = get_definitions_from_function_object(decorated_func)
-        setattr(
-            wrapper,
-            FunctionAttributes.declaration,
-            FunctionDeclaration.from_inferred_func_declaration(
-                inferred_func=decorated_func,
-                all_type_definitions=function_definitions["all"],
-                self_definition=function_definitions["self"],
-                return_type_definition=function_definitions["return_type"],
-                param_definitions=function_definitions["params"],
-            ),
-        )
-        setattr(
-            wrapper,
-            FunctionAttributes.frame,
-            Frame(
-                type_definitions=function_definitions["all"],
-                tests=FrameTests(),
-                parents=[Frame.for_module(decorated_func.__module__)],
-            ),
-        )
+    # only dev functions are wrapped, prod ones are returned undecorated
+    setattr(wrapper, FunctionAttributes.is_dev, True)
+    # classifying the signature is slow, so the declaration and frame are built on first access
+    setattr(
+        wrapper,
+        FunctionAttributes.build_resources,
+        lambda: _assign_function_resources(wrapper, decorated_func),
+    )
+
+
+def _assign_function_resources(wrapper: Callable, decorated_func: Callable):
+    # dev only, so prod never imports the classification machinery
+    from codespeak.frame import Frame
+    from codespeak.frame_tests import FrameTests
+    from codespeak.function.function_declaration import FunctionDeclaration
+    from codespeak.helpers.get_definitions_from_function_object import (
+        get_definitions_from_function_object,
+    )
+
+    function_definitions = get_definitions_from_function_object(decorated_func)
+    setattr(
+        wrapper,
+        FunctionAttributes.declaration,
+        FunctionDeclaration.from_inferred_func_declaration(
+            inferred_func=decorated_func,
+            all_type_definitions=function_definitions["all"],
+            self_definition=function_definitions["self"],
+            return_type_definition=function_definitions["return_type"],
+            param_definitions=function_definitions["params"],
+        ),
+    )
+    setattr(
+        wrapper,
+        FunctionAttributes.frame,
+        Frame(
+            type_definitions=function_definitions["all"],
+            tests=FrameTests(),
+            parents=[Frame.for_module(decorated_func.__module__)],
+        ),
+    )
@@ -1,68 +1,57 @@
-from typing import Sequence
+from typing import Dict
 import libcst as cst
-import textwrap
 from libcst import BaseCompoundStatement, FunctionDef, SimpleStatementLine, CSTNode
+from codespeak.helpers.write_file_atomically import write_file_atomically
+from codespeak.helpers.parsed_source_file import (
+    get_parsed_source_file,
+    invalidate_parsed_source_file,
+)
 
 
 class ReplaceFunctionTransformer(cst.CSTTransformer):
     def __init__(
         self,
-        function_name: str,
-        new_function_def: SimpleStatementLine | BaseCompoundStatement,
+        new_function_defs: Dict[
+            FunctionDef, SimpleStatementLine | BaseCompoundStatement
+        ],
     ) -> None:
-        self.new_function_def = new_function_def
-        self.function_name = function_name
+        # keyed on the original nodes, which libcst compares by identity
+        self.new_function_defs = new_function_defs
 
     def leave_FunctionDef(
         self, original_node: FunctionDef, updated_node: FunctionDef
     ) -> CSTNode:
-        if original_node.name.value == self.function_name:
-            return self.new_function_def
+        if original_node in self.new_function_defs:
+            return self.new_function_defs[original_node]
         return updated_node
 
 
-def get_function_node(
-    name: str, body: Sequence[SimpleStatementLine | BaseCompoundStatement]
-) -> FunctionDef:
-    for node in body:
-        if isinstance(node, cst.FunctionDef):
-            if node.name.value == name:
-                return node
-    raise ValueError(f"Function {name} not found in body")
-
-
 def replace_function(filepath: str, function_name: str, new_source_code: str):
-    replaceable_code = ""
-    with open(filepath, "r") as f:
-        replaceable_code = f.read()
+    replace_functions(filepath, {function_name: new_source_code})
 
-    # Parse the source code into CSTs
-    module = cst.parse_module(replaceable_code)
-    # new_function_def = cst.parse_statement(new_function)
-    new_function_def = cst.parse_statement(new_source_code)
 
-    # Get the original function
-    original_function_def = get_function_node(function_name, module.body)
-    # [
-    #     node for node in module.body if isinstance(node, cst.FunctionDef)
-    # ][0]
+def replace_functions(filepath: str, new_source_codes: Dict[str, str]):
+    """Replaces functions by qualname with a single transform and a single write of the file"""
+    # Reuse the parse of the file that was made when checking the functions
+    parsed = get_parsed_source_file(filepath)
+    module = parsed.cst_module
 
-    # Extract leading lines from original function
-    leading_lines = original_function_def.leading_lines
+    new_function_defs = {}
+    for qualname, new_source_code in new_source_codes.items():
+        new_function_def = cst.parse_statement(new_source_code)
 
-    # Add leading lines to new function
-    new_function_with_comments = new_function_def.with_changes(
-        leading_lines=leading_lines
-    )
+        # Get the original function
+        original_function_def = parsed.cst_function(qualname)
+
+        # Add leading lines (comments, blank lines) from the original function to the new one
+        new_function_defs[original_function_def] = new_function_def.with_changes(
+            leading_lines=original_function_def.leading_lines
+        )
 
     # Create an instance of the transformer and apply it to the CST
-    transformer = ReplaceFunctionTransformer(
-        function_name=function_name, new_function_def=new_function_with_comments
-    )
+    transformer = ReplaceFunctionTransformer(new_function_defs=new_function_defs)
     new_module = module.visit(transformer)
 
     # Convert the CST back into source code
-    new_source_code = new_module.code
-
-    with open(filepath, "w") as f:
-        f.write(new_source_code)
+    write_file_atomically(filepath, new_module.code)
+    invalidate_parsed_source_file(filepath)
@@ -0,0 +1,232 @@
+import importlib
+import importlib.util
+import inspect
+import os
+import pkgutil
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+from codespeak.decorate.writable import get_source_file, should_write_function
+from codespeak.decorate.writable_transform import replace_functions
+from codespeak.function.dependency_index import (
+    current_dependency_hashes,
+    function_key,
+    local_class_dependencies,
+)
+from codespeak.function.function_attributes import FunctionAttributes
+from codespeak.function.function_metadata import (
+    FunctionMetadata,
+    build_function_metadata,
+    record_function_metadata,
+)
+from codespeak.function.writable_function import WritableFunction
+from codespeak.helpers.auto_detect_abspath_to_project_root import (
+    auto_detect_abspath_to_project_root,
+)
+from codespeak.helpers.derive_module_qualname_for_object import (
+    derive_module_qualname_from_filepaths,
+)
+from codespeak.helpers.run_coroutine_sync import run_coroutine_sync
+from codespeak.inference import codespeak_service
+from codespeak.inference.inference_scheduler import (
+    DEFAULT_MAX_CONCURRENCY,
+    InferenceResult,
+    InferenceScheduler,
+)
+from codespeak.settings import settings
+
+
+def write_all(
+    module_or_path: ModuleType | str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[str]:
+    """
+    Writes every @writable stub in a module, package, file or directory of packages in one pass.
+
+    Inferences run concurrently, and each source file is rewritten once with all of its replacements.
+
+    Args:
+        module_or_path (ModuleType | str): A module object, an importable module name, or a path to a python file or a directory. Only packages in a directory are loaded.
+        max_concurrency (int, optional): The most inferences to run at once. Defaults to 16.
+
+    Returns:
+        List[str]: the import paths of the functions that were written.
+    """
+    stubs = find_writable_stubs(load_modules(module_or_path))
+    return write_functions(
+        [WritableFunction(stub) for stub in stubs], max_concurrency=max_concurrency
+    )
+
+
+def write_functions(
+    writable_functions: List[WritableFunction],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[str]:
+    """Infers and writes each function, rewriting each source file once, and records metadata for what was written"""
+    if len(writable_functions) == 0:
+        return []
+    api_identifier = settings.get_current_api_identifier()
+    if api_identifier is None:
+        raise ValueError("No api set. Add an api with codespeak.add_api()")
+    scheduler = InferenceScheduler(
+        api_identifier=api_identifier, max_concurrency=max_concurrency
+    )
+    function_lites = [
+        writable_function.to_function_lite() for writable_function in writable_functions
+    ]
+    results = run_coroutine_sync(
+        codespeak_service.closing_client(scheduler.run_all(function_lites))
+    )
+
+    new_source_codes_by_file: Dict[str, Dict[str, str]] = {}
+    succeeded: List[Tuple[str, WritableFunction, InferenceResult]] = []
+    written: List[str] = []
+    failed: List[Any] = []
+    for writable_function, result in zip(writable_functions, results):
+        func = writable_function.func
+        if result.source_code is None:
+            failed.append((func.__qualname__, result.error))
+            continue
+        source_file = get_source_file(func.__wrapped__)
+        new_source_codes_by_file.setdefault(source_file, {})[
+            func.__qualname__
+        ] = result.source_code
+        succeeded.append((source_file, writable_function, result))
+        written.append(func.__module__ + "." + func.__qualname__)
+    for source_file, new_source_codes in new_source_codes_by_file.items():
+        replace_functions(source_file, new_source_codes)
+    # after every file is written, since writing a method changes the source of its class
+    metadata_by_file: Dict[str, Dict[str, FunctionMetadata]] = {}
+    for source_file, writable_function, result in succeeded:
+        qualname = writable_function.func.__qualname__
+        metadata_by_file.setdefault(source_file, {})[
+            qualname
+        ] = build_function_metadata(
+            declaration=writable_function.declaration,
+            function_lite=result.function_lite,
+            source_code=result.source_code or "",
+            api_identifier=api_identifier,
+            inference_seconds=result.seconds or 0,
+            dependencies=current_dependency_hashes(
+                local_class_dependencies(
+                    writable_function.frame.type_definitions_with_inheritance
+                ),
+                function_key(source_file, qualname),
+            ),
+        )
+    for source_file, functions in metadata_by_file.items():
+        record_function_metadata(source_file, functions)
+    if len(failed) > 0:
+        raise Exception("Unable to write some functions: ", failed)
+    return written
+
+
+def find_writable_stubs(modules: List[ModuleType]) -> List[Callable]:
+    return [
+        func
+        for func in find_writable_functions(modules)
+        if should_write_function(func.__wrapped__)
+    ]
+
+
+def find_writable_functions(modules: List[ModuleType]) -> List[Callable]:
+    """Every @writable function defined in modules, written or not"""
+    functions: Dict[int, Callable] = {}
+    for module in modules:
+        for obj in list(vars(module).values()):
+            candidates = [obj]
+            if inspect.isclass(obj) and obj.__module__ == module.__name__:
+                candidates = list(vars(obj).values())
+            for candidate in candidates:
+                if isinstance(candidate, (staticmethod, classmethod)):
+                    candidate = candidate.__func__
+                if is_writable_function(candidate, module):
+                    functions[id(candidate)] = candidate
+    return list(functions.values())
+
+
+def is_writable_function(candidate: Any, module: ModuleType) -> bool:
+    if not callable(candidate) or not hasattr(candidate, "__wrapped__"):
+        return False
+    if not getattr(candidate, FunctionAttributes.is_dev, False):
+        return False
+    # skip writable functions imported from other modules
+    return getattr(candidate, "__module__", None) == module.__name__
+
+
+def load_modules(module_or_path: ModuleType | str) -> List[ModuleType]:
+    if isinstance(module_or_path, ModuleType):
+        return with_submodules(module_or_path)
+    if os.path.isdir(module_or_path):
+        return load_packages_in_directory(module_or_path)
+    if os.path.isfile(module_or_path):
+        return [load_module_from_file(module_or_path)]
+    return with_submodules(importlib.import_module(module_or_path))
+
+
+# directories that never hold the project's own packages
+SKIPPED_DIRECTORY_NAMES = {"__pycache__", "site-packages", "node_modules", "test", "tests"}
+
+
+def load_packages_in_directory(directory: str) -> List[ModuleType]:
+    """
+    Modules of every package in directory, or under it.
+
+    Only directories with an __init__.py are imported, so scripts like setup.py, dot-directories and virtualenvs are left alone. Pass a loose module by its path.
+    """
+    modules = []
+    for path, dirnames, filenames in os.walk(directory):
+        is_package = "__init__.py" in filenames
+        # once inside a package only its subpackages belong to it, above one any directory may hold a package
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not should_skip_directory(os.path.join(path, name))
+            and (
+                not is_package
+                or os.path.isfile(os.path.join(path, name, "__init__.py"))
+            )
+        )
+        if not is_package:
+            continue
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                modules.append(load_module_from_file(os.path.join(path, filename)))
+    return modules
+
+
+def should_skip_directory(path: str) -> bool:
+    name = os.path.basename(path)
+    if name.startswith(".") or name in SKIPPED_DIRECTORY_NAMES:
+        return True
+    # a virtualenv, whatever it's called
+    return os.path.isfile(os.path.join(path, "pyvenv.cfg"))
+
+
+def with_submodules(module: ModuleType) -> List[ModuleType]:
+    modules = [module]
+    if hasattr(module, "__path__"):
+        for info in pkgutil.walk_packages(module.__path__, module.__name__ + "."):
+            modules.append(importlib.import_module(info.name))
+    return modules
+
+
+def load_module_from_file(path: str) -> ModuleType:
+    path = os.path.abspath(path)
+    for module in list(sys.modules.values()):
+        if getattr(module, "__file__", None) == path:
+            return module
+    # module names follow the configured root, so they match what metadata and classification derive
+    abspath_to_project_root = settings.get_abspath_to_project_root()
+    if not abspath_to_project_root:
+        abspath_to_project_root = auto_detect_abspath_to_project_root(
+            os.path.dirname(path)
+        )
+    name = derive_module_qualname_from_filepaths(path, abspath_to_project_root)
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise Exception("Unable to load module from file: ", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -1,18 +1,23 @@
 import inspect
 import json
 import sys
-from typing import Any, Callable, Dict, List, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from codespeak.public.inferred_exception import InferredExceptionHelpers
 from codespeak.type_definitions import classify
 from codespeak.type_definitions.type_definition import TypeDefinition
+from codespeak.type_definitions.type_graph import TypeGraph
 from codespeak.function.function_attributes import FunctionAttributes
 from codespeak.function.function_manager import FunctionManager
 from codespeak.frame_tests import FrameTests
 from codespeak.helpers.guarantee_abspath_to_root_exists import (
     guarantee_abspath_to_project_root_exists,
 )
+from codespeak.helpers.guarantee_function_resources_exist import (
+    guarantee_function_resources_exist,
+)
 from codespeak.helpers.self_type import self_type_if_exists
 from codespeak.test_function import TestFunction
 
@@ -24,18 +29,43 @@ class Frame(BaseModel):
     type_definitions: Set[TypeDefinition] = set()
     tests: FrameTests = FrameTests()
     parents: List["Frame"] = []
-
-    def custom_types(self) -> Dict:
-        types_ = {}
-        for _class in self.type_definitions:
-            types_.update(_class.custom_types())
+    # bumped whenever the frame's resources change, invalidating the custom types snapshot
+    _version: int = PrivateAttr(default=0)
+    _custom_types: Mapping | None = PrivateAttr(default=None)
+    _custom_types_version: Tuple | None = PrivateAttr(default=None)
+
+    class Config:
+        # parents are held by reference, so a child sees their version counters and not a copy's
+        copy_on_model_validation = "none"
+
+    def custom_types(self) -> Mapping:
+        """Read-only snapshot of the custom types for this frame and its parents, rebuilt only after they change"""
+        version = self.version()
+        if self._custom_types is None or self._custom_types_version != version:
+            self._custom_types = MappingProxyType(self.collect_custom_types())
+            self._custom_types_version = version
+        return self._custom_types
+
+    def collect_custom_types(self) -> Dict:
+        types_ = TypeGraph(self.type_definitions).custom_types
         for parent in self.parents:
             types_.update(parent.custom_types())
         types_.update(InferredExceptionHelpers.annotate())
         return types_
 
+    def version(self) -> Tuple:
+        # sizes are included so direct edits to type_definitions or parents are noticed too
+        return (
+            self._version,
+            len(self.type_definitions),
+            tuple(parent.version() for parent in self.parents),
+        )
+
+    def mark_changed(self):
+        self._version += 1
+
     def printable_custom_types(self) -> str:
-        return json.dumps(self.custom_types(), indent=4)
+        return json.dumps(dict(self.custom_types()), indent=4)
 
     def printable_type_definitions_with_inheritance(self) -> str:
         return json.dumps(
@@ -47,6 +77,7 @@ class Frame(BaseModel):
             if not inspect.isclass(_class):
                 raise ValueError(f"Expected class object, got {type(_class).__name__}")
             self.type_definitions.add(classify.from_any(_class))
+        self.mark_changed()
 
     def add_test_function(self, test_func: Callable):
         if not test_func.__name__.startswith("test_"):
@@ -81,6 +112,7 @@ class Frame(BaseModel):
     @staticmethod
     def for_function(func: Callable[..., Any]) -> "Frame":
         """get classified Function object for an inferred function"""
+        guarantee_function_resources_exist(func)
         if not hasattr(func, FunctionAttributes.frame):
             raise Exception(
                 "No frame found. Make sure this is an inferred function—it should use codespeak's @infer decorator"
@@ -1 +1,15 @@
-from .writable_function import WritableFunction
+from typing import TYPE_CHECKING
+
+
+# loaded on first access, so importing a module under codespeak.function doesn't pull in
+# writable_function, which imports back into frame and the inference engine
+def __getattr__(name: str):
+    if name == "WritableFunction":
+        from .writable_function import WritableFunction
+
+        return WritableFunction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if TYPE_CHECKING:
+    from .writable_function import WritableFunction
@@ -0,0 +1,166 @@
+import os
+from typing import Dict, Iterable, List, Set, Tuple
+from codespeak.function.function_metadata import (
+    ModuleMetadata,
+    load_all_module_metadata,
+    mark_functions_stale,
+    source_hash,
+)
+from codespeak.helpers.parsed_source_file import get_parsed_source_file
+from codespeak.settings import settings
+from codespeak.type_definitions.type_definition import TypeDefinition
+from codespeak.type_definitions.type_graph import TypeGraph
+
+# absolute path to the source file, qualname
+FunctionKey = Tuple[str, str]
+
+
+def function_key(source_file: str, qualname: str) -> FunctionKey:
+    return (os.path.abspath(source_file), qualname)
+
+
+def local_class_dependencies(definitions: Iterable[TypeDefinition]) -> Dict[str, str]:
+    """Import path -> source hash of every local class reachable from definitions, through type hints and bases too"""
+    graph = TypeGraph(definitions)
+    return {
+        import_path: source_hash(definition.source_code)
+        for import_path, definition in graph.visited.items()
+        if definition.type == "LocalClass"
+    }
+
+
+def locate_class_source(import_path: str) -> Tuple[str, str, str] | None:
+    """
+    Source file, qualname and source of a local class as it is in its file now, found from its import path without importing it.
+
+    None when the class can't be found statically, like when it was removed or is defined under an if.
+    """
+    root = settings.get_abspath_to_project_root()
+    parts = import_path.split(".")
+    # the longest module prefix with a file wins, the rest is the qualname
+    for i in range(len(parts) - 1, 0, -1):
+        module_path = os.path.abspath(os.path.join(root, *parts[:i]))
+        for path in (module_path + ".py", os.path.join(module_path, "__init__.py")):
+            if not os.path.isfile(path):
+                continue
+            qualname = ".".join(parts[i:])
+            try:
+                class_source = get_parsed_source_file(path).class_source(qualname)
+            except (ValueError, SyntaxError):
+                return None
+            return (path, qualname, class_source)
+    return None
+
+
+def dependency_hash(
+    located: Tuple[str, str, str], dependent: FunctionKey
+) -> str | None:
+    """Source hash of a located class as a dependent function sees it"""
+    path, class_qualname, class_source = located
+    source_file, qualname = dependent
+    if source_file == path and qualname.startswith(class_qualname + "."):
+        # a method's own body is what gets generated, so it isn't part of its class as a dependency
+        try:
+            function_source = get_parsed_source_file(path).function_source(qualname)
+        except (ValueError, SyntaxError):
+            return None
+        class_source = class_source.replace(function_source, "", 1)
+    return source_hash(class_source)
+
+
+def current_dependency_hashes(
+    dependencies: Dict[str, str], dependent: FunctionKey
+) -> Dict[str, str]:
+    """dependencies with each class hashed from its file as it is now, for recording right after a write"""
+    current = {}
+    for import_path, recorded_hash in dependencies.items():
+        located = locate_class_source(import_path)
+        current_hash = None if located is None else dependency_hash(located, dependent)
+        current[import_path] = recorded_hash if current_hash is None else current_hash
+    return current
+
+
+class DependencyIndex:
+    """
+    Reverse index from the import path of a local class to the generated functions that depend on it, built from the metadata store.
+
+    Only dependents of a class whose source changed are stale, everything else can be skipped without classifying it.
+    """
+
+    def __init__(self) -> None:
+        # import path -> functions that depend on it
+        self.dependents: Dict[str, Set[FunctionKey]] = {}
+        # function -> import path -> source hash when it was inferred
+        self.dependencies: Dict[FunctionKey, Dict[str, str]] = {}
+        # functions with no dependencies on record, which can't be checked this way
+        self.untracked: Set[FunctionKey] = set()
+
+    def add(self, key: FunctionKey, dependencies: Dict[str, str] | None):
+        if dependencies is None:
+            self.untracked.add(key)
+            return
+        self.dependencies[key] = dependencies
+        for import_path in dependencies:
+            self.dependents.setdefault(import_path, set()).add(key)
+
+    def add_module_metadata(self, metadata: ModuleMetadata):
+        source_file = metadata.abspath_to_source_file()
+        for qualname, function_metadata in metadata.functions.items():
+            self.add(function_key(source_file, qualname), function_metadata.dependencies)
+
+    @staticmethod
+    def from_metadata() -> "DependencyIndex":
+        index = DependencyIndex()
+        for metadata in load_all_module_metadata():
+            index.add_module_metadata(metadata)
+        return index
+
+    def dependents_of(self, import_path: str) -> Set[FunctionKey]:
+        return self.dependents.get(import_path, set())
+
+    def located_classes(self) -> Dict[str, Tuple[str, str, str] | None]:
+        # each class is read once, however many functions depend on it
+        return {
+            import_path: locate_class_source(import_path)
+            for import_path in self.dependents
+        }
+
+    def stale_functions(
+        self, located: Dict[str, Tuple[str, str, str] | None] | None = None
+    ) -> Set[FunctionKey]:
+        """Functions that depend on a class whose source no longer matches what they were inferred from"""
+        if located is None:
+            located = self.located_classes()
+        stale: Set[FunctionKey] = set()
+        for import_path, located_class in located.items():
+            if located_class is None:
+                continue
+            for key in self.dependents_of(import_path):
+                current_hash = dependency_hash(located_class, key)
+                if (
+                    current_hash is not None
+                    and self.dependencies[key][import_path] != current_hash
+                ):
+                    stale.add(key)
+        return stale
+
+    def unverifiable_functions(
+        self, located: Dict[str, Tuple[str, str, str] | None] | None = None
+    ) -> Set[FunctionKey]:
+        """Functions with no dependencies on record, or one on a class that can't be read statically"""
+        if located is None:
+            located = self.located_classes()
+        unverifiable = set(self.untracked)
+        for import_path, located_class in located.items():
+            if located_class is None:
+                unverifiable.update(self.dependents_of(import_path))
+        return unverifiable
+
+
+def mark_stale_functions(stale: Iterable[FunctionKey]):
+    """Persists the stale flag, so the functions stay queued for re-inference until they're written again"""
+    qualnames_by_file: Dict[str, List[str]] = {}
+    for source_file, qualname in stale:
+        qualnames_by_file.setdefault(source_file, []).append(qualname)
+    for source_file, qualnames in qualnames_by_file.items():
+        mark_functions_stale(source_file, qualnames)
@@ -4,3 +4,5 @@ class FunctionAttributes:
     declaration = "_declaration"
     file_service = "_file_service"
     is_dev = "_is_dev"
+    build_resources = "_build_resources"
+    should_write = "_should_write"
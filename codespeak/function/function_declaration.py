@@ -9,6 +9,10 @@ from pydantic import BaseModel
 from codespeak.function.function_declaration_lite import (
     FunctionDeclarationLite,
     TypeDefinitionLite,
+    intern_type_definition_lite,
+)
+from codespeak.helpers.parsed_source_file import (
+    try_get_parsed_source_file_for_function,
 )
 from codespeak.public.inferred_exception import InferredExceptionHelpers
 from codespeak.type_definitions import classify
@@ -44,10 +48,11 @@ class FunctionDeclaration(BaseModel):
     # potentially buggy
     def imports_text(self) -> str:
         _str = ""
-        for module, types in self.import_definitions.items():
+        # sorted so the text, and the inference cache key built from it, is the same every run
+        for module, types in sorted(self.import_definitions.items()):
             if module == "builtins" or module == "None":
                 continue
-            _str += f"from {module} import {', '.join([_type.qualname for _type in types])}\n"
+            _str += f"from {module} import {', '.join(sorted(_type.qualname for _type in types))}\n"
         _str += InferredExceptionHelpers.import_text()
         return _str
 
@@ -65,7 +70,15 @@ class FunctionDeclaration(BaseModel):
         return_type_definition: TypeDefinition | None,
         param_definitions: Set[TypeDefinition],
     ) -> "FunctionDeclaration":
-        source_code = textwrap.dedent(inspect.getsource(inferred_func))
+        parsed = try_get_parsed_source_file_for_function(inferred_func)
+        if parsed is None:
+            source_code = textwrap.dedent(inspect.getsource(inferred_func))
+            function_node = None
+        else:
+            source_code = textwrap.dedent(
+                parsed.function_source(inferred_func.__qualname__)
+            )
+            function_node = parsed.ast_function(inferred_func.__qualname__)
 
         declaration = FunctionDeclaration(
             name=inferred_func.__name__,
@@ -79,6 +92,7 @@ class FunctionDeclaration(BaseModel):
                 self_definition_qualname=self_definition.qualname
                 if self_definition
                 else None,
+                function_node=function_node,
             ),
             self_definition=self_definition,
             return_type_definition=return_type_definition,
@@ -100,15 +114,15 @@ class FunctionDeclaration(BaseModel):
                 if _def.is_a_union_type():
                     continue
                 return_types.append(
-                    TypeDefinitionLite(
-                        module=_def.module, qualname=_def.qualname, type=_def.type
+                    intern_type_definition_lite(
+                        type=_def.type, module=_def.module, qualname=_def.qualname
                     )
                 )
         params: list[TypeDefinitionLite] = []
-        for _def in self.param_definitions:
+        for _def in sorted(self.param_definitions):
             params.append(
-                TypeDefinitionLite(
-                    module=_def.module, qualname=_def.qualname, type=_def.type
+                intern_type_definition_lite(
+                    type=_def.type, module=_def.module, qualname=_def.qualname
                 )
             )
 
@@ -159,18 +173,24 @@ def signature_text_with_self_definition(
 
 
 def build_signature_text(
-    func_name: str, source_code: str, self_definition_qualname: str | None
+    func_name: str,
+    source_code: str,
+    self_definition_qualname: str | None,
+    function_node: ast.FunctionDef | ast.AsyncFunctionDef | None = None,
 ) -> str:
-    module = ast.parse(source_code)
+    if function_node is None:
+        module = ast.parse(source_code)
+        for node in module.body:
+            if isinstance(node, ast.FunctionDef) and node.name == func_name:
+                function_node = node
+                break
     signature: str | None = None
-    for node in module.body:
-        if isinstance(node, ast.FunctionDef) and node.name == func_name:
-            # Reconstruct the function signature from the 'args' attribute
-            signature = f"def {node.name}({ast.unparse(node.args)})"
-            if node.returns:  # If there's a return annotation, add it
-                signature += f" -> {ast.unparse(node.returns)}"
-            signature += ":"
-            break
+    if isinstance(function_node, ast.FunctionDef):
+        # Reconstruct the function signature from the 'args' attribute
+        signature = f"def {function_node.name}({ast.unparse(function_node.args)})"
+        if function_node.returns:  # If there's a return annotation, add it
+            signature += f" -> {ast.unparse(function_node.returns)}"
+        signature += ":"
     if signature is None:
         raise Exception("function signature not found")
     if self_definition_qualname is not None:
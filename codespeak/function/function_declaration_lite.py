@@ -1,5 +1,6 @@
+from typing import Dict, Tuple
 from pydantic import BaseModel
-import ast, astor
+import ast
 
 
 class TypeDefinitionLite(BaseModel):
@@ -7,7 +8,17 @@ class TypeDefinitionLite(BaseModel):
     module: str
     qualname: str
 
+    class Config:
+        # instances are interned and shared, so they can't change, and aren't copied into models that hold them
+        allow_mutation = False
+        copy_on_model_validation = "none"
+
+    def __hash__(self):
+        return hash((self.module, self.qualname))
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, TypeDefinitionLite):
             return self.import_path() == other.import_path()
         return False
@@ -16,6 +27,19 @@ class TypeDefinitionLite(BaseModel):
         return self.module + "." + self.qualname
 
 
+# one shared instance per type and import path, bounded by the number of types a project uses
+_type_definition_lites: Dict[Tuple[str, str, str], TypeDefinitionLite] = {}
+
+
+def intern_type_definition_lite(type: str, module: str, qualname: str) -> TypeDefinitionLite:
+    key = (type, module, qualname)
+    definition = _type_definition_lites.get(key)
+    if definition is None:
+        definition = TypeDefinitionLite(type=type, module=module, qualname=qualname)
+        definition = _type_definition_lites.setdefault(key, definition)
+    return definition
+
+
 class FunctionDeclarationLite(BaseModel):
     name: str
     qualname: str
@@ -46,6 +70,8 @@ class FunctionDeclarationLite(BaseModel):
             if isinstance(statement, ast.FunctionDef):
                 statement.name = self.name
                 break
+        import astor
+
         new_file = astor.to_source(module)
         self.incomplete_file = new_file.rstrip("\n")
 
@@ -63,6 +89,8 @@ class FunctionDeclarationLite(BaseModel):
                 break
 
         # Generate the source code back from the AST
+        import astor
+
         new_source_code = astor.to_source(module)
         self.incomplete_file = new_source_code.rstrip("\n")
 
@@ -96,5 +124,7 @@ class FunctionDeclarationLite(BaseModel):
                 new_body.append(statement)
 
         module.body = new_body
+        import astor
+
         new_file = astor.to_source(module)
         self.incomplete_file = new_file.rstrip("\n")
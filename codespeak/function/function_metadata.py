@@ -0,0 +1,248 @@
+import ast
+import hashlib
+import json
+import os
+import textwrap
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+from pydantic import BaseModel
+from codespeak.constants import codespeak_dirname, metadata_file_prefix
+from codespeak.function.function_declaration import (
+    FunctionDeclaration,
+    build_signature_text,
+)
+from codespeak.function.function_lite import FunctionLite
+from codespeak.helpers.derive_module_qualname_for_object import (
+    derive_module_qualname_from_filepaths,
+)
+from codespeak.helpers.parsed_source_file import get_parsed_source_file
+from codespeak.helpers.write_file_atomically import write_file_atomically
+from codespeak.settings import settings
+
+METADATA_FILE_SUFFIX = ".json"
+
+
+class FunctionMetadata(BaseModel):
+    """What was generated for a writable function, and what it was generated from"""
+
+    # None when the written function's declaration couldn't be read back, which always counts as changed
+    declaration_fingerprint: str | None
+    custom_types_fingerprint: str
+    source_hash: str
+    api_identifier: str
+    inferred_at: float
+    inference_seconds: float
+    # import path -> source hash of each local class the function depended on when it was inferred
+    dependencies: Dict[str, str] | None = None
+    # set when a class it depends on changed, until it's inferred again
+    stale: bool = False
+
+
+class ModuleMetadata(BaseModel):
+    """Metadata for the generated functions in one source file, keyed by qualname"""
+
+    # relative to the project root, so the project can move
+    source_file: str
+    functions: Dict[str, FunctionMetadata] = {}
+
+    def abspath_to_source_file(self) -> str:
+        return os.path.join(settings.get_abspath_to_project_root(), self.source_file)
+
+
+def fingerprint(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def declaration_fingerprint(qualname: str, signature_text: str, docstring: str) -> str:
+    # only what the user writes in the stub. The body is generated and imports follow from the custom types
+    return fingerprint(
+        {"qualname": qualname, "signature_text": signature_text, "docstring": docstring}
+    )
+
+
+def declaration_fingerprint_for_function_lite(function_lite: FunctionLite) -> str:
+    declaration = function_lite.declaration
+    return declaration_fingerprint(
+        declaration.qualname, declaration.signature_text, declaration.docstring
+    )
+
+
+def declaration_fingerprint_for_written_source(
+    declaration: FunctionDeclaration, source_code: str
+) -> str | None:
+    """
+    Fingerprint of the declaration as it reads once source_code replaces the stub.
+
+    Inferences can reword the docstring, so this is what the next run will compare against, not the stub's.
+    """
+    try:
+        module = ast.parse(textwrap.dedent(source_code))
+        signature_text = build_signature_text(
+            func_name=declaration.name,
+            source_code=source_code,
+            self_definition_qualname=declaration.self_definition.qualname
+            if declaration.self_definition
+            else None,
+        )
+    except Exception:
+        return None
+    docstring = ""
+    for node in module.body:
+        if isinstance(node, ast.FunctionDef) and node.name == declaration.name:
+            docstring = ast.get_docstring(node) or ""
+            break
+    return declaration_fingerprint(declaration.qualname, signature_text, docstring)
+
+
+def custom_types_fingerprint(custom_types: Mapping[str, Any]) -> str:
+    return fingerprint(dict(custom_types))
+
+
+def source_hash(source_code: str) -> str:
+    # dedented and stripped, so a method hashes the same as it reads indented in its file
+    return hashlib.sha256(textwrap.dedent(source_code).strip().encode()).hexdigest()
+
+
+def build_function_metadata(
+    declaration: FunctionDeclaration,
+    function_lite: FunctionLite,
+    source_code: str,
+    api_identifier: str,
+    inference_seconds: float,
+    dependencies: Dict[str, str],
+) -> FunctionMetadata:
+    """Metadata for source_code, inferred from function_lite, once it has replaced the function"""
+    return FunctionMetadata(
+        declaration_fingerprint=declaration_fingerprint_for_written_source(
+            declaration, source_code
+        ),
+        custom_types_fingerprint=custom_types_fingerprint(function_lite.custom_types),
+        source_hash=source_hash(source_code),
+        api_identifier=api_identifier,
+        inferred_at=time.time(),
+        inference_seconds=inference_seconds,
+        dependencies=dependencies,
+    )
+
+
+def has_changed(function_lite: FunctionLite, metadata: FunctionMetadata) -> bool:
+    """Whether the declaration or the custom types it depends on changed since metadata was recorded"""
+    if has_declaration_changed(function_lite, metadata):
+        return True
+    return metadata.custom_types_fingerprint != custom_types_fingerprint(
+        function_lite.custom_types
+    )
+
+
+def has_declaration_changed(
+    function_lite: FunctionLite, metadata: FunctionMetadata
+) -> bool:
+    return metadata.declaration_fingerprint != declaration_fingerprint_for_function_lite(
+        function_lite
+    )
+
+
+def get_metadata_dir() -> str:
+    return os.path.join(settings.get_abspath_to_project_root(), codespeak_dirname)
+
+
+def metadata_path(source_file: str) -> str:
+    module_qualname = derive_module_qualname_from_filepaths(
+        source_file, settings.get_abspath_to_project_root()
+    )
+    return os.path.join(
+        get_metadata_dir(), metadata_file_prefix + module_qualname + METADATA_FILE_SUFFIX
+    )
+
+
+# path -> (mtime and size of the file when read, metadata), so checking many functions reads each file once
+_module_metadata: Dict[str, Tuple[Tuple[int, int], ModuleMetadata]] = {}
+
+
+def load_module_metadata(source_file: str) -> ModuleMetadata | None:
+    return load_module_metadata_at(metadata_path(source_file))
+
+
+def load_module_metadata_at(path: str) -> ModuleMetadata | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _module_metadata.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    metadata = ModuleMetadata.parse_file(path)
+    _module_metadata[path] = (version, metadata)
+    return metadata
+
+
+def load_function_metadata(source_file: str, qualname: str) -> FunctionMetadata | None:
+    metadata = load_module_metadata(source_file)
+    if metadata is None:
+        return None
+    return metadata.functions.get(qualname)
+
+
+def record_function_metadata(source_file: str, functions: Dict[str, FunctionMetadata]):
+    """Adds or replaces the metadata for functions in source_file, with one write of its metadata file"""
+    path = metadata_path(source_file)
+    existing = load_module_metadata_at(path)
+    metadata = ModuleMetadata(
+        source_file=os.path.relpath(
+            os.path.abspath(source_file), settings.get_abspath_to_project_root()
+        ),
+        functions={**(existing.functions if existing else {}), **functions},
+    )
+    save_module_metadata(path, metadata)
+
+
+def save_module_metadata(path: str, metadata: ModuleMetadata):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_file_atomically(path, metadata.json(indent=4))
+    _module_metadata.pop(path, None)
+
+
+def mark_functions_stale(source_file: str, qualnames: Iterable[str]):
+    path = metadata_path(source_file)
+    metadata = load_module_metadata_at(path)
+    if metadata is None:
+        return
+    functions = dict(metadata.functions)
+    for qualname in qualnames:
+        if qualname in functions and not functions[qualname].stale:
+            functions[qualname] = functions[qualname].copy(update={"stale": True})
+    if functions != metadata.functions:
+        save_module_metadata(path, metadata.copy(update={"functions": functions}))
+
+
+def is_written_source_unchanged(
+    source_file: str, qualname: str, metadata: FunctionMetadata
+) -> bool:
+    """Whether the function still reads exactly as it was written, checked from its file without importing anything"""
+    try:
+        current_source = get_parsed_source_file(source_file).function_source(qualname)
+    except (ValueError, SyntaxError):
+        return False
+    return source_hash(current_source) == metadata.source_hash
+
+
+def load_all_module_metadata() -> List[ModuleMetadata]:
+    directory = get_metadata_dir()
+    if not os.path.isdir(directory):
+        return []
+    all_metadata = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.startswith(metadata_file_prefix) and filename.endswith(
+            METADATA_FILE_SUFFIX
+        ):
+            metadata = load_module_metadata_at(os.path.join(directory, filename))
+            if metadata is not None:
+                all_metadata.append(metadata)
+    return all_metadata
+
+
+def source_files_with_metadata() -> List[str]:
+    """Absolute paths of every source file that has generated functions on record"""
+    return [metadata.abspath_to_source_file() for metadata in load_all_module_metadata()]
@@ -1,14 +1,26 @@
 import inspect
 import json
+import time
 from typing import Any, Callable, Dict, List, ClassVar, Tuple
 from codespeak.function.function_declaration import FunctionDeclaration
+from codespeak.function.dependency_index import (
+    current_dependency_hashes,
+    function_key,
+    local_class_dependencies,
+)
 from codespeak.function.function_lite import FunctionLite
+from codespeak.function.function_metadata import (
+    build_function_metadata,
+    record_function_metadata,
+)
 from codespeak.helpers.self_type import self_type_if_exists
-from codespeak.decorate.writable_transform import replace_function
 from codespeak.inference.inference_engine import InferenceEngine
 from codespeak.frame import Frame
 from codespeak.function.function_attributes import FunctionAttributes
 from codespeak.function.function_declaration_lite import FunctionDeclarationLite
+from codespeak.helpers.guarantee_function_resources_exist import (
+    guarantee_function_resources_exist,
+)
 from codespeak.settings import settings
 
 
@@ -16,6 +28,7 @@ class WritableFunction:
     func: Callable
 
     def __init__(self, func: Callable) -> None:
+        guarantee_function_resources_exist(func)
         if not hasattr(func, FunctionAttributes.frame):
             raise Exception(
                 "No frame found. Make sure this is an inferred function—it should use codespeak's @infer decorator"
@@ -31,18 +44,21 @@ class WritableFunction:
         return Frame.for_function(self.func)
 
     def _make_inference(self) -> str:
+        return self._inference_engine().make_inference()
+
+    def _inference_engine(self) -> InferenceEngine:
         function_lite = self.to_function_lite()
         api_identifier = settings.get_current_api_identifier()
         if api_identifier is None:
             raise ValueError("No api set. Add an api with codespeak.add_api()")
-        api_inference_engine = InferenceEngine(
+        return InferenceEngine(
             function_lite=function_lite,
             api_identifier=api_identifier,
         )
-        return api_inference_engine.make_inference()
 
     def source_file(self) -> str:
-        ff = inspect.getsourcefile(self.func)
+        # the wrapper's code lives in writable.py, the stub's file is on the function it wraps
+        ff = inspect.getsourcefile(inspect.unwrap(self.func))
         if ff is None:
             raise ValueError("Function must be defined in a file")
         return ff
@@ -51,8 +67,33 @@ class WritableFunction:
         self._write(self.source_file())
 
     def _write(self, source_file: str) -> None:
-        inference = self._make_inference()
+        # libcst is only loaded once something is written
+        from codespeak.decorate.writable_transform import replace_function
+
+        engine = self._inference_engine()
+        started = time.perf_counter()
+        inference = engine.make_inference()
+        inference_seconds = time.perf_counter() - started
         replace_function(source_file, self.func.__qualname__, inference)
+        record_function_metadata(
+            source_file,
+            {
+                self.func.__qualname__: build_function_metadata(
+                    declaration=self.declaration,
+                    function_lite=engine.function_lite,
+                    source_code=inference,
+                    api_identifier=engine.api_identifier,
+                    inference_seconds=inference_seconds,
+                    # hashed from the file after the write, which changes the source of the class a method is on
+                    dependencies=current_dependency_hashes(
+                        local_class_dependencies(
+                            self.frame.type_definitions_with_inheritance
+                        ),
+                        function_key(source_file, self.func.__qualname__),
+                    ),
+                )
+            },
+        )
 
     def to_function_lite(self) -> FunctionLite:
         return FunctionLite(
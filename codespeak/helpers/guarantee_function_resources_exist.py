@@ -0,0 +1,11 @@
+from typing import Callable
+from codespeak.function.function_attributes import FunctionAttributes
+
+
+def guarantee_function_resources_exist(func: Callable):
+    """Builds the declaration and frame for a writable function the first time they're needed"""
+    if hasattr(func, FunctionAttributes.frame):
+        return
+    build_resources = getattr(func, FunctionAttributes.build_resources, None)
+    if build_resources is not None:
+        build_resources()
@@ -0,0 +1,173 @@
+import ast
+import inspect
+import os
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import libcst as cst
+
+
+class ParsedSourceFile:
+    """Text, ast and libcst trees for a source file, parsed at most once per version of the file"""
+
+    def __init__(self, path: str, version: Tuple[int, int], text: str) -> None:
+        self.path = path
+        self.version = version
+        self.text = text
+        self._ast_module: ast.Module | None = None
+        self._cst_module: "cst.Module | None" = None
+        self._ast_functions: Dict[str, ast.FunctionDef | ast.AsyncFunctionDef] = {}
+        self._cst_functions: Dict[str, "cst.FunctionDef"] = {}
+        self._ast_classes: Dict[str, ast.ClassDef] = {}
+        self._lines: List[str] | None = None
+
+    @property
+    def ast_module(self) -> ast.Module:
+        if self._ast_module is None:
+            self._ast_module = ast.parse(self.text)
+        return self._ast_module
+
+    @property
+    def cst_module(self) -> "cst.Module":
+        if self._cst_module is None:
+            # libcst is slow to import, so it's loaded the first time a file needs a cst
+            import libcst as cst
+
+            self._cst_module = cst.parse_module(self.text)
+        return self._cst_module
+
+    def ast_function(self, qualname: str) -> ast.FunctionDef | ast.AsyncFunctionDef:
+        if qualname not in self._ast_functions:
+            node = find_node_for_qualname(
+                qualname, self.ast_module.body, ast_children, ast_name
+            )
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                raise ValueError(f"Function {qualname} not found in {self.path}")
+            self._ast_functions[qualname] = node
+        return self._ast_functions[qualname]
+
+    def cst_function(self, qualname: str) -> "cst.FunctionDef":
+        import libcst as cst
+
+        if qualname not in self._cst_functions:
+            node = find_node_for_qualname(
+                qualname, self.cst_module.body, cst_children, cst_name
+            )
+            if not isinstance(node, cst.FunctionDef):
+                raise ValueError(f"Function {qualname} not found in {self.path}")
+            self._cst_functions[qualname] = node
+        return self._cst_functions[qualname]
+
+    def ast_class(self, qualname: str) -> ast.ClassDef:
+        if qualname not in self._ast_classes:
+            node = find_node_for_qualname(
+                qualname, self.ast_module.body, ast_children, ast_name
+            )
+            if not isinstance(node, ast.ClassDef):
+                raise ValueError(f"Class {qualname} not found in {self.path}")
+            self._ast_classes[qualname] = node
+        return self._ast_classes[qualname]
+
+    def function_source(self, qualname: str) -> str:
+        """Source of a function including its decorators, like inspect.getsource"""
+        return self.node_source(self.ast_function(qualname))
+
+    def class_source(self, qualname: str) -> str:
+        """Source of a class including its decorators, like inspect.getsource"""
+        return self.node_source(self.ast_class(qualname))
+
+    def node_source(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+    ) -> str:
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        if self._lines is None:
+            self._lines = self.text.splitlines(keepends=True)
+        return "".join(self._lines[start - 1 : node.end_lineno])
+
+
+_parsed_source_files: Dict[str, ParsedSourceFile] = {}
+
+
+def source_file_version(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_parsed_source_file(path: str) -> ParsedSourceFile:
+    path = os.path.abspath(path)
+    version = source_file_version(path)
+    parsed = _parsed_source_files.get(path)
+    if parsed is None or parsed.version != version:
+        with open(path, "r") as f:
+            text = f.read()
+        parsed = ParsedSourceFile(path=path, version=version, text=text)
+        _parsed_source_files[path] = parsed
+    return parsed
+
+
+def invalidate_parsed_source_file(path: str):
+    _parsed_source_files.pop(os.path.abspath(path), None)
+
+
+def is_locatable_qualname(qualname: str) -> bool:
+    # functions defined inside other functions can't be looked up statically
+    return "<locals>" not in qualname
+
+
+def find_node_for_qualname(qualname: str, body: Sequence, children, name):
+    node = None
+    for part in qualname.split("."):
+        node = None
+        # later definitions shadow earlier ones, same as at runtime
+        for child in body:
+            if name(child) == part:
+                node = child
+        if node is None:
+            return None
+        body = children(node)
+    return node
+
+
+def ast_name(node: ast.AST) -> str | None:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    return None
+
+
+def ast_children(node: ast.AST) -> List[ast.stmt]:
+    return getattr(node, "body", [])
+
+
+def cst_name(node: "cst.CSTNode") -> str | None:
+    import libcst as cst
+
+    if isinstance(node, (cst.FunctionDef, cst.ClassDef)):
+        return node.name.value
+    return None
+
+
+def cst_children(node: "cst.CSTNode") -> Sequence["cst.CSTNode"]:
+    import libcst as cst
+
+    if isinstance(node, (cst.FunctionDef, cst.ClassDef)) and isinstance(
+        node.body, cst.IndentedBlock
+    ):
+        return node.body.body
+    return []
+
+
+def try_get_parsed_source_file_for_function(func: Callable) -> ParsedSourceFile | None:
+    """Parsed source file for a function that can be located by its qualname, otherwise None"""
+    return try_get_parsed_source_file_for_object(func)
+
+
+def try_get_parsed_source_file_for_object(
+    _object: Callable | type,
+) -> ParsedSourceFile | None:
+    if not is_locatable_qualname(_object.__qualname__):
+        return None
+    source_file = inspect.getsourcefile(_object)
+    if source_file is None or not os.path.exists(source_file):
+        return None
+    return get_parsed_source_file(source_file)
+
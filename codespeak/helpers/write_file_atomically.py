@@ -0,0 +1,18 @@
+import os
+import shutil
+import tempfile
+
+
+def write_file_atomically(filepath: str, text: str):
+    """Writes to a temp file in the same directory and renames it over filepath, so readers never see half a file"""
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, temp_path)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
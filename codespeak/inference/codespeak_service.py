@@ -1,12 +1,78 @@
+import asyncio
 import json
 import re
-import httpx
+import ssl
+from typing import TYPE_CHECKING, Dict
+from weakref import WeakKeyDictionary
 from codespeak.function.function_lite import FunctionLite
 
+if TYPE_CHECKING:
+    import httpx
+
 
 url = "http://localhost:8000"
 # url = "codespeak-api-production.up.railway.app"
 
+# httpx.Limits arguments, kept as plain values so httpx only loads when a client is created
+client_limits: Dict[str, float] = {
+    "max_connections": 20,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30,
+}
+# connections belong to the event loop they were opened on, so there's one client per loop
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = (
+    WeakKeyDictionary()
+)
+# loading the certificate store is slow, so every client shares one context
+_ssl_context: ssl.SSLContext | None = None
+
+
+def configure_client(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+):
+    """Sets the connection pool limits for inference clients created from now on"""
+    global client_limits
+    client_limits = {
+        "max_connections": max_connections or client_limits["max_connections"],
+        "max_keepalive_connections": max_keepalive_connections
+        or client_limits["max_keepalive_connections"],
+        "keepalive_expiry": keepalive_expiry or client_limits["keepalive_expiry"],
+    }
+
+
+def get_client() -> "httpx.AsyncClient":
+    """The pooled client for the running event loop, created on first use"""
+    import httpx
+
+    global _ssl_context
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        if _ssl_context is None:
+            _ssl_context = httpx.create_ssl_context()
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(**client_limits), verify=_ssl_context
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_client():
+    """Closes the running event loop's client and its pooled connections"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def closing_client(coroutine):
+    """Awaits coroutine, then closes the client. For sync entry points whose event loop ends with the call."""
+    try:
+        return await coroutine
+    finally:
+        await close_client()
+
 
 @staticmethod
 async def make_inference(function_lite: FunctionLite, api_identifier: str) -> str:
@@ -15,15 +81,16 @@ async def make_inference(function_lite: FunctionLite, api_identifier: str) -> st
         "function_lite": function_lite.dict(),
         "api": api_identifier,
     }
-    response_text = ""
     _url = f"{url}{path}"
-    async with httpx.AsyncClient() as client:
-        async with client.stream("POST", url=_url, json=data, timeout=30) as response:
-            async for chunk in response.aiter_bytes():
-                text = chunk.decode()
-                response_text += text
-                print(text, end="")
-    print("\n")
+    client = get_client()
+    chunks = []
+    async with client.stream("POST", url=_url, json=data, timeout=30) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+    # printed whole once it's complete, since many inferences can stream at once
+    response_text = b"".join(chunks).decode()
+    print(response_text + "\n")
     return response_text
 
 
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING
+from codespeak.constants import codespeak_dirname, inferences_dirname
+from codespeak.helpers.write_file_atomically import write_file_atomically
+from codespeak.settings import settings
+
+if TYPE_CHECKING:
+    from codespeak.function.function_lite import FunctionLite
+
+INFERENCE_FILE_SUFFIX = ".txt"
+
+
+def inference_cache_key(function_lite: "FunctionLite", api_identifier: str) -> str:
+    """Stable hash of everything sent for an inference, the same across runs for an unchanged function"""
+    payload = json.dumps(
+        {"function_lite": function_lite.dict(), "api": api_identifier},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_inferences_dir() -> str | None:
+    """None when no project root is set, so the cache is skipped rather than written relative to the working directory"""
+    abspath_to_project_root = settings.get_abspath_to_project_root()
+    if not abspath_to_project_root:
+        return None
+    return os.path.join(abspath_to_project_root, codespeak_dirname, inferences_dirname)
+
+
+def inference_path(key: str) -> str | None:
+    directory = get_inferences_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, key + INFERENCE_FILE_SUFFIX)
+
+
+def load_inference(key: str) -> str | None:
+    path = inference_path(key)
+    if path is None:
+        return None
+    try:
+        with open(path, "r") as f:
+            source_code = f.read()
+    except FileNotFoundError:
+        return None
+    # eviction goes by modification time, so a hit marks the entry recently used
+    os.utime(path)
+    return source_code
+
+
+def store_inference(key: str, source_code: str):
+    directory = get_inferences_dir()
+    if directory is None:
+        return
+    os.makedirs(directory, exist_ok=True)
+    write_file_atomically(
+        os.path.join(directory, key + INFERENCE_FILE_SUFFIX), source_code
+    )
+    evict_inferences(settings.get_inference_cache_max_bytes())
+
+
+def evict_inferences(max_bytes: int):
+    """Removes the least recently used inferences until the cache fits in max_bytes"""
+    directory = get_inferences_dir()
+    if directory is None or not os.path.isdir(directory):
+        return
+    entries = []
+    total = 0
+    with os.scandir(directory) as scan:
+        for entry in scan:
+            if not entry.name.endswith(INFERENCE_FILE_SUFFIX):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def clear_inference_cache():
+    evict_inferences(0)
@@ -4,6 +4,13 @@ from typing import Any, Callable, Dict, List, Tuple
 from pydantic import BaseModel
 from codespeak.function.function_lite import FunctionLite
 from codespeak.inference import codespeak_service
+from codespeak.inference.inference_cache import (
+    inference_cache_key,
+    load_inference,
+    store_inference,
+)
+from codespeak.settings import settings
+from codespeak.helpers.run_coroutine_sync import run_coroutine_sync
 from codespeak.helpers.extract_delimited_python_code_from_string import (
     extract_delimited_python_code_from_string,
 )
@@ -14,8 +21,26 @@ class InferenceEngine(BaseModel):
     function_lite: FunctionLite
 
     def make_inference(self) -> str:
-        inference = asyncio.run(
-            codespeak_service.make_inference(self.function_lite, self.api_identifier)
+        return run_coroutine_sync(
+            codespeak_service.closing_client(self.make_inference_async())
+        )
+
+    async def make_inference_async(self) -> str:
+        """Source code for the function, reused from the on-disk cache when nothing sent for it has changed"""
+        use_cache = settings.get_use_inference_cache()
+        if use_cache:
+            key = inference_cache_key(self.function_lite, self.api_identifier)
+            cached = load_inference(key)
+            if cached is not None:
+                return cached
+        source_code = await self.request_inference()
+        if use_cache:
+            store_inference(key, source_code)
+        return source_code
+
+    async def request_inference(self) -> str:
+        inference = await codespeak_service.make_inference(
+            self.function_lite, self.api_identifier
         )
         inference = extract_delimited_python_code_from_string(inference)
         original_source = self.function_lite.declaration.source_code
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from typing import AsyncIterator, List
+import httpx
+from pydantic import BaseModel
+from codespeak.function.function_lite import FunctionLite
+from codespeak.inference.inference_engine import InferenceEngine
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+# errors worth another attempt, anything else (like a malformed response or a bad request) fails right away
+RETRYABLE_ERRORS = (httpx.TransportError, asyncio.TimeoutError)
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        # rate limited or a server error, other 4xx won't succeed on another attempt
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+class InferenceResult(BaseModel):
+    """Outcome of one scheduled inference. index is the position of its FunctionLite in the input."""
+
+    index: int
+    function_lite: FunctionLite
+    source_code: str | None = None
+    error: BaseException | None = None
+    # how long the attempt that succeeded took
+    seconds: float | None = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class InferenceScheduler:
+    """Runs many inferences concurrently with a bound on parallelism, a timeout per attempt, and retries with exponential backoff"""
+
+    def __init__(
+        self,
+        api_identifier: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = 60,
+        max_retries: int = 2,
+        backoff: float = 0.5,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.api_identifier = api_identifier
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    async def as_completed(
+        self, function_lites: List[FunctionLite]
+    ) -> AsyncIterator[InferenceResult]:
+        """Yields results in the order they finish"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._infer(index, function_lite, semaphore))
+            for index, function_lite in enumerate(function_lites)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run_all(self, function_lites: List[FunctionLite]) -> List[InferenceResult]:
+        """Results in the same order as function_lites"""
+        results: List[InferenceResult | None] = [None] * len(function_lites)
+        async for result in self.as_completed(function_lites):
+            results[result.index] = result
+        return [result for result in results if result is not None]
+
+    async def _infer(
+        self, index: int, function_lite: FunctionLite, semaphore: asyncio.Semaphore
+    ) -> InferenceResult:
+        engine = InferenceEngine(
+            function_lite=function_lite, api_identifier=self.api_identifier
+        )
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    started = time.perf_counter()
+                    source_code = await asyncio.wait_for(
+                        engine.make_inference_async(), timeout=self.timeout
+                    )
+                    seconds = time.perf_counter() - started
+                return InferenceResult(
+                    index=index,
+                    function_lite=function_lite,
+                    source_code=source_code,
+                    seconds=seconds,
+                )
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    return InferenceResult(
+                        index=index, function_lite=function_lite, error=e
+                    )
+            # back off outside the semaphore so other inferences can use the slot
+            await asyncio.sleep(self.backoff * 2**attempt)
+            attempt += 1
@@ -1,14 +1,108 @@
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List
+
+WILDCARD = "*"
+
+Accessor = Callable[[Any, Any], Any]
 
 
 def dot_get(data_dict: Dict, map_str: str, default_value: Any = None) -> Any:
-    if data_dict is None:
-        return default_value
-    map_list = map_str.split(".")
-    for k in map_list:
-        if k not in data_dict:
+    """
+    Gets a nested value with a dot separated path, like "company.owner.name".
+
+    Integer keys index into lists ("items.0.id"), and "*" maps the rest of the path over every element of a list or dict ("items.*.id"). Returns default_value if any part of the path is missing or None.
+    """
+    return compile_accessor(map_str)(data_dict, default_value)
+
+
+def dot_get_many(
+    records: Iterable[Dict], map_str: str, default_value: Any = None
+) -> List[Any]:
+    """dot_get for every record in records, parsing map_str once"""
+    accessor = compile_accessor(map_str)
+    return [accessor(record, default_value) for record in records]
+
+
+@lru_cache(maxsize=1024)
+def compile_accessor(map_str: str) -> Accessor:
+    return accessor_for_keys(map_str.split("."))
+
+
+def accessor_for_keys(keys: List[str]) -> Accessor:
+    if WILDCARD in keys:
+        position = keys.index(WILDCARD)
+        container_keys, rest_keys = keys[:position], keys[position + 1 :]
+        return wildcard_accessor(
+            accessor_for_keys(container_keys) if container_keys else None,
+            accessor_for_keys(rest_keys) if rest_keys else None,
+        )
+    if any(is_index(k) for k in keys):
+        return indexing_accessor(keys)
+    return key_accessor(tuple(keys))
+
+
+def is_index(k: str) -> bool:
+    try:
+        int(k)
+    except ValueError:
+        return False
+    return True
+
+
+def key_accessor(keys: tuple) -> Accessor:
+    def get(data: Any, default_value: Any) -> Any:
+        if data is None:
+            return default_value
+        try:
+            for k in keys:
+                data = data[k]
+                if data is None:
+                    return default_value
+        except (KeyError, TypeError):
             return default_value
-        data_dict = data_dict[k]
-        if data_dict is None:
+        return data
+
+    return get
+
+
+def indexing_accessor(keys: List[str]) -> Accessor:
+    # integer keys look up dicts by the string and lists by the index
+    steps = tuple((k, int(k) if is_index(k) else None) for k in keys)
+
+    def get(data: Any, default_value: Any) -> Any:
+        if data is None:
             return default_value
-    return data_dict
+        for k, index in steps:
+            if isinstance(data, list):
+                if index is None or not -len(data) <= index < len(data):
+                    return default_value
+                data = data[index]
+            else:
+                try:
+                    data = data[k]
+                except (KeyError, TypeError):
+                    return default_value
+            if data is None:
+                return default_value
+        return data
+
+    return get
+
+
+def wildcard_accessor(
+    get_container: Accessor | None, get_rest: Accessor | None
+) -> Accessor:
+    def get(data: Any, default_value: Any) -> Any:
+        if get_container is not None:
+            data = get_container(data, default_value)
+        if isinstance(data, dict):
+            elements = data.values()
+        elif isinstance(data, list):
+            elements = data
+        else:
+            return default_value
+        if get_rest is None:
+            return list(elements)
+        return [get_rest(element, default_value) for element in elements]
+
+    return get
@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 from typing import Dict
 
 
@@ -22,7 +23,7 @@ class InferredExceptionHelpers:
     def annotate() -> Dict:
         qualname = "InferredException"
         module = "codespeak"
-        source_code = inspect.getsource(InferredException)
+        source_code = InferredExceptionHelpers.source_code()
         return {
             f"{module}.{qualname}": {
                 "module": module,
@@ -31,6 +32,11 @@ class InferredExceptionHelpers:
             }
         }
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def source_code() -> str:
+        return inspect.getsource(InferredException)
+
     @staticmethod
     def import_text() -> str:
         return f"from codespeak import InferredException\n"
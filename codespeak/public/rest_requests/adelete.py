@@ -0,0 +1,57 @@
+from typing import Dict, List, Any
+import httpx
+from codespeak.public.rest_requests.request import Request
+from codespeak.public.rest_requests.rest_request_helpers import get_async_client
+
+
+async def adelete(
+    api: str,
+    path: str,
+    path_params: Dict[str, Any] | None = None,
+    query_params: Dict[str, Any] | None = None,
+    data: Dict[str, Any] | None = None,
+    json: Dict[str, Any] | None = None,
+    cookies: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+):
+    """
+    Makes an async delete request to an api with automatic authentication and formatted params. No api keys required. Uses a pooled httpx client, so many requests can run concurrently.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        data (Dict[str, Any], optional): The data to use in the operation request. Defaults to None.
+        json (Dict[str, Any], optional): The json to use in the operation request. Defaults to None.
+        path_params (Dict[str, str], optional): The path parameters to use in the operation. Defaults to None.
+        query_params (Dict[str, str], optional): The query parameters to use in the operation. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in the operation. Defaults to {}.
+
+    Returns:
+        type: the json-encoded content of the response, if any.
+    """
+    request = Request(
+        api=api,
+        path=path,
+        api_key=None,
+        path_params=path_params,
+        query_params=query_params,
+        data=data,
+        json_=json,
+        cookies=cookies,
+        headers=headers,
+    )
+    request.authenticate()
+    response = await get_async_client(request.api).request(
+        "DELETE",
+        url=request.make_url(),
+        data=request.data,
+        json=request.json_,
+        params=request.query_params,
+        headers=request.headers,
+        cookies=request.cookies,
+    )
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise e
+    return response.json()
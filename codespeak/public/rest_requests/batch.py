@@ -0,0 +1,281 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+from pydantic import BaseModel
+from codespeak.public.rest_requests.delete import delete
+from codespeak.public.rest_requests.get import get
+from codespeak.public.rest_requests.post import post
+from codespeak.public.rest_requests.put import put
+from codespeak.public.rest_requests.rest_request_helpers import get_rate_limiter
+
+DEFAULT_MAX_WORKERS = 10
+
+# max_workers -> executor, shared across batches so their threads and keep-alive sessions are reused
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+class BatchResult(BaseModel):
+    """Outcome of one request in a batch, either the json-encoded content of the response or the error it raised"""
+
+    value: Any = None
+    error: BaseException | None = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def batch_get(
+    api: str,
+    path: str,
+    path_params_list: List[Dict[str, Any]] | None = None,
+    query_params_list: List[Dict[str, Any]] | None = None,
+    headers: Dict[str, Any] = {},
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[BatchResult]:
+    """
+    Makes many get requests to an api concurrently. The i-th request uses the i-th entry of each params list.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params_list (List[Dict[str, Any]], optional): The path parameters for each request. Defaults to None.
+        query_params_list (List[Dict[str, Any]], optional): The query parameters for each request. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in every request. Defaults to {}.
+        max_workers (int, optional): The most requests in flight at once. Defaults to 10.
+
+    Returns:
+        List[BatchResult]: one result per request, in input order. A failed request doesn't fail the batch.
+    """
+    return run_batch(
+        api=api,
+        send=get,
+        kwargs_list=zip_params(
+            path_params=path_params_list, query_params=query_params_list
+        ),
+        shared_kwargs={"api": api, "path": path},
+        headers=headers,
+        max_workers=max_workers,
+    )
+
+
+def batch_post(
+    api: str,
+    path: str,
+    path_params_list: List[Dict[str, Any]] | None = None,
+    query_params_list: List[Dict[str, Any]] | None = None,
+    data_list: List[Dict[str, Any]] | None = None,
+    json_list: List[Dict[str, Any]] | None = None,
+    cookies: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[BatchResult]:
+    """
+    Makes many post requests to an api concurrently. The i-th request uses the i-th entry of each list.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params_list (List[Dict[str, Any]], optional): The path parameters for each request. Defaults to None.
+        query_params_list (List[Dict[str, Any]], optional): The query parameters for each request. Defaults to None.
+        data_list (List[Dict[str, Any]], optional): The data for each request. Defaults to None.
+        json_list (List[Dict[str, Any]], optional): The json for each request. Defaults to None.
+        cookies (Dict[str, Any], optional): The cookies to use in every request. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in every request. Defaults to {}.
+        max_workers (int, optional): The most requests in flight at once. Defaults to 10.
+
+    Returns:
+        List[BatchResult]: one result per request, in input order. A failed request doesn't fail the batch.
+    """
+    return run_batch_with_body(
+        send=post,
+        api=api,
+        path=path,
+        path_params_list=path_params_list,
+        query_params_list=query_params_list,
+        data_list=data_list,
+        json_list=json_list,
+        cookies=cookies,
+        headers=headers,
+        max_workers=max_workers,
+    )
+
+
+def batch_put(
+    api: str,
+    path: str,
+    path_params_list: List[Dict[str, Any]] | None = None,
+    query_params_list: List[Dict[str, Any]] | None = None,
+    data_list: List[Dict[str, Any]] | None = None,
+    json_list: List[Dict[str, Any]] | None = None,
+    cookies: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[BatchResult]:
+    """
+    Makes many put requests to an api concurrently. The i-th request uses the i-th entry of each list.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params_list (List[Dict[str, Any]], optional): The path parameters for each request. Defaults to None.
+        query_params_list (List[Dict[str, Any]], optional): The query parameters for each request. Defaults to None.
+        data_list (List[Dict[str, Any]], optional): The data for each request. Defaults to None.
+        json_list (List[Dict[str, Any]], optional): The json for each request. Defaults to None.
+        cookies (Dict[str, Any], optional): The cookies to use in every request. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in every request. Defaults to {}.
+        max_workers (int, optional): The most requests in flight at once. Defaults to 10.
+
+    Returns:
+        List[BatchResult]: one result per request, in input order. A failed request doesn't fail the batch.
+    """
+    return run_batch_with_body(
+        send=put,
+        api=api,
+        path=path,
+        path_params_list=path_params_list,
+        query_params_list=query_params_list,
+        data_list=data_list,
+        json_list=json_list,
+        cookies=cookies,
+        headers=headers,
+        max_workers=max_workers,
+    )
+
+
+def batch_delete(
+    api: str,
+    path: str,
+    path_params_list: List[Dict[str, Any]] | None = None,
+    query_params_list: List[Dict[str, Any]] | None = None,
+    data_list: List[Dict[str, Any]] | None = None,
+    json_list: List[Dict[str, Any]] | None = None,
+    cookies: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[BatchResult]:
+    """
+    Makes many delete requests to an api concurrently. The i-th request uses the i-th entry of each list.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params_list (List[Dict[str, Any]], optional): The path parameters for each request. Defaults to None.
+        query_params_list (List[Dict[str, Any]], optional): The query parameters for each request. Defaults to None.
+        data_list (List[Dict[str, Any]], optional): The data for each request. Defaults to None.
+        json_list (List[Dict[str, Any]], optional): The json for each request. Defaults to None.
+        cookies (Dict[str, Any], optional): The cookies to use in every request. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in every request. Defaults to {}.
+        max_workers (int, optional): The most requests in flight at once. Defaults to 10.
+
+    Returns:
+        List[BatchResult]: one result per request, in input order. A failed request doesn't fail the batch.
+    """
+    return run_batch_with_body(
+        send=delete,
+        api=api,
+        path=path,
+        path_params_list=path_params_list,
+        query_params_list=query_params_list,
+        data_list=data_list,
+        json_list=json_list,
+        cookies=cookies,
+        headers=headers,
+        max_workers=max_workers,
+    )
+
+
+def run_batch_with_body(
+    send: Callable[..., Any],
+    api: str,
+    path: str,
+    path_params_list: List[Dict[str, Any]] | None,
+    query_params_list: List[Dict[str, Any]] | None,
+    data_list: List[Dict[str, Any]] | None,
+    json_list: List[Dict[str, Any]] | None,
+    cookies: Dict[str, Any] | None,
+    headers: Dict[str, Any],
+    max_workers: int,
+) -> List[BatchResult]:
+    return run_batch(
+        api=api,
+        send=send,
+        kwargs_list=zip_params(
+            path_params=path_params_list,
+            query_params=query_params_list,
+            data=data_list,
+            json=json_list,
+        ),
+        shared_kwargs={"api": api, "path": path, "cookies": cookies},
+        headers=headers,
+        max_workers=max_workers,
+    )
+
+
+def zip_params(**params_lists: List[Dict[str, Any]] | None) -> List[Dict[str, Any]]:
+    """Turns parallel lists of params into one kwargs dict per request"""
+    lengths = {len(params) for params in params_lists.values() if params is not None}
+    if len(lengths) == 0:
+        raise ValueError("Expected at least one list of params")
+    if len(lengths) > 1:
+        raise ValueError("Expected all lists of params to have the same length")
+    length = lengths.pop()
+    return [
+        {
+            name: params[i] if params is not None else None
+            for name, params in params_lists.items()
+        }
+        for i in range(length)
+    ]
+
+
+def run_batch(
+    api: str,
+    send: Callable[..., Any],
+    kwargs_list: List[Dict[str, Any]],
+    shared_kwargs: Dict[str, Any],
+    headers: Dict[str, Any],
+    max_workers: int,
+) -> List[BatchResult]:
+    rate_limiter = get_rate_limiter(api)
+
+    def run_one(kwargs: Dict[str, Any]) -> BatchResult:
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        try:
+            # each request gets its own headers, since authenticate() writes to them
+            return BatchResult(
+                value=send(**shared_kwargs, **kwargs, headers=dict(headers))
+            )
+        except Exception as e:
+            return BatchResult(error=e)
+
+    # map keeps results in input order, and sessions are per thread so workers don't share one
+    return list(get_executor(max_workers).map(run_one, kwargs_list))
+
+
+def get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """The shared executor for batches with max_workers, created on first use"""
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="codespeak-batch"
+            )
+            _executors[max_workers] = executor
+        return executor
+
+
+def shutdown_executors():
+    """Stops the shared batch executors' threads, which closes their sessions. Later batches start new ones."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
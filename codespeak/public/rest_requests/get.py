@@ -1,9 +1,10 @@
 from typing import Dict, List, Any
 import requests
-from furl import furl
 from codespeak.apis import api_keys
 from codespeak.public.inferred_exception import InferredException
 from codespeak.public.rest_requests.request import Request
+from codespeak.public.rest_requests.rest_request_helpers import get_session
+from codespeak.public.rest_requests.response_cache import get_response_cache
 
 
 def get(
@@ -12,6 +13,7 @@ def get(
     path_params: Dict[str, Any] | None = None,
     query_params: Dict[str, Any] | None = None,
     headers: Dict[str, Any] = {},
+    use_cache: bool = True,
 ):
     """
     Makes a get request to an api with automatic authentication and formatted params. No api keys required.
@@ -22,6 +24,7 @@ def get(
         path_params (Dict[str, str], optional): The path parameters to use in the operation. Defaults to None.
         query_params (Dict[str, str], optional): The query parameters to use in the operation. Defaults to None.
         headers (Dict[str, str], optional): The headers to use in the operation. Defaults to {}.
+        use_cache (bool, optional): Whether to use the response cache, if it's enabled. Defaults to True.
 
     Returns:
         type: the json-encoded content of the response, if any.
@@ -38,8 +41,19 @@ def get(
         headers=headers,
     )
     request.authenticate()
-    response = requests.get(
-        url=request.make_url(),
+    url = request.make_url()
+    session = get_session(request.api)
+    response_cache = get_response_cache()
+    if use_cache and response_cache is not None:
+        return response_cache.fetch(
+            request,
+            url,
+            lambda headers: session.get(
+                url=url, params=request.query_params, headers=headers
+            ),
+        )
+    response = session.get(
+        url=url,
         params=request.query_params,
         headers=request.headers,
     )
@@ -0,0 +1,75 @@
+from typing import Any, Dict, Iterator
+from codespeak.apis.api_metadata import api_metadatas
+from codespeak.public.dot_get import dot_get
+from codespeak.public.rest_requests.get import get
+
+
+def paginate(
+    api: str,
+    path: str,
+    path_params: Dict[str, Any] | None = None,
+    query_params: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+) -> Iterator[Any]:
+    """
+    Walks every page of a list endpoint and yields its items one at a time, following the pagination style declared for the api. Only one page is held in memory at a time. No api keys required.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params (Dict[str, str], optional): The path parameters to use in the operation. Defaults to None.
+        query_params (Dict[str, str], optional): The query parameters to use in the first page. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in the operation. Defaults to {}.
+
+    Returns:
+        type: an iterator over the json-decoded items of every page.
+    """
+    pagination = api_metadatas[api].get("pagination")
+    if pagination is None:
+        raise ValueError(f"No pagination declared for api {api}")
+    style = pagination.get("style")
+    items_path = pagination.get("items_path")
+    page_query_params = dict(query_params or {})
+
+    if style == "cursor":
+        cursor_param = pagination["cursor_param"]
+        next_cursor_path = pagination["next_cursor_path"]
+        while True:
+            page = get(api, path, path_params, page_query_params, dict(headers))
+            yield from page_items(page, items_path)
+            cursor = dot_get(page, next_cursor_path)
+            if not cursor:
+                return
+            page_query_params[cursor_param] = cursor
+    elif style == "offset":
+        offset_param = pagination.get("offset_param", "offset")
+        limit_param = pagination.get("limit_param", "limit")
+        page_size = pagination.get("page_size", 100)
+        total_path = pagination.get("total_path")
+        next_path = pagination.get("next_path")
+        offset = page_query_params.get(offset_param, 0)
+        page_query_params[limit_param] = page_size
+        while True:
+            page_query_params[offset_param] = offset
+            page = get(api, path, path_params, page_query_params, dict(headers))
+            items = page_items(page, items_path)
+            yield from items
+            # a short page isn't necessarily the last, servers can cap the page size below the limit asked for
+            if len(items) == 0:
+                return
+            offset += len(items)
+            if total_path is not None:
+                total = dot_get(page, total_path)
+                if total is not None and offset >= total:
+                    return
+            if next_path is not None and not dot_get(page, next_path):
+                return
+    else:
+        raise ValueError(f"Unknown pagination style {style} for api {api}")
+
+
+def page_items(page: Any, items_path: str | None) -> list:
+    items = page if items_path is None else dot_get(page, items_path, [])
+    if not isinstance(items, list):
+        raise ValueError("Expected the items of a page to be a list")
+    return items
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, List, Tuple
+from urllib.parse import quote
+
+# furl leaves these unencoded in path segments
+SAFE_SEGMENT_CHARS = ":@-._~!$&'()*+,;="
+
+
+def build_url_with_path_params(base_url: str, path: str, path_params: Dict[str, str]):
+    return join_url(base_url, path.format(**path_params))
+
+
+def join_url(base_url: str, path: str) -> str:
+    # imported here so furl only loads when a template is compiled or a url needs the slow path
+    from furl import furl
+
+    url = furl(base_url)
+    url /= path
+    return url.url
+
+
+class PathTemplate:
+    """
+    A (base_url, path) pair compiled once into literal url pieces with a slot for each path param.
+
+    Produces the same urls as build_url_with_path_params. Values that furl treats specially (containing '/' or '%', or empty or dot segments) fall back to it.
+    """
+
+    def __init__(self, base_url: str, path: str) -> None:
+        self.base_url = base_url
+        self.path = path
+        # literals[i] comes before fields[i], and literals[-1] after the last field
+        self.literals: List[str] | None = None
+        self.fields: List[Tuple[str, str]] = []
+        self.compile()
+
+    def compile(self):
+        sentinel_path = ""
+        sentinels = []
+        for literal, name, spec, conversion in Formatter().parse(self.path):
+            sentinel_path += literal
+            if name is None:
+                continue
+            # positional, attribute and index fields are left to str.format
+            if not name.isidentifier() or conversion is not None:
+                return
+            sentinel = f"codespeakfield{len(sentinels)}sentinel"
+            if sentinel in self.base_url or sentinel in self.path:
+                return
+            sentinels.append(sentinel)
+            self.fields.append((name, spec or ""))
+            sentinel_path += sentinel
+        url = join_url(self.base_url, sentinel_path)
+        literals = []
+        for sentinel in sentinels:
+            pieces = url.split(sentinel)
+            if len(pieces) != 2:
+                return
+            literals.append(pieces[0])
+            url = pieces[1]
+        literals.append(url)
+        self.literals = literals
+
+    def build(self, path_params: Dict[str, Any]) -> str:
+        if self.literals is None:
+            return build_url_with_path_params(self.base_url, self.path, path_params)
+        url = self.literals[0]
+        for (name, spec), literal in zip(self.fields, self.literals[1:]):
+            value = format(path_params[name], spec)
+            if "/" in value or "%" in value or value in ("", ".", ".."):
+                return build_url_with_path_params(
+                    self.base_url, self.path, path_params
+                )
+            url += quote(value, SAFE_SEGMENT_CHARS) + literal
+        return url
+
+
+@lru_cache(maxsize=1024)
+def compile_path_template(base_url: str, path: str) -> PathTemplate:
+    return PathTemplate(base_url=base_url, path=path)
@@ -1,6 +1,7 @@
 from typing import Dict, List, Any
 import requests
 from codespeak.public.rest_requests.request import Request
+from codespeak.public.rest_requests.rest_request_helpers import get_session
 
 
 def put(
@@ -40,7 +41,7 @@ def put(
         headers=headers,
     )
     request.authenticate()
-    response = requests.put(
+    response = get_session(request.api).put(
         url=request.make_url(),
         data=request.data,
         json=request.json_,
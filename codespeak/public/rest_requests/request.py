@@ -1,6 +1,7 @@
 from typing import Any, Callable, Dict
 from pydantic import BaseModel
 from codespeak.apis.api_metadata import api_metadatas
+from codespeak.public.rest_requests.path_template import compile_path_template
 from codespeak.settings import settings
 
 
@@ -32,23 +33,13 @@ class Request(BaseModel):
 
     def make_url(self) -> str:
         if self.path_params is not None and len(self.path_params.keys()) > 0:
-            return build_url_with_path_params(
-                self.base_url, path=self.path, path_params=self.path_params
+            return compile_path_template(self.base_url, self.path).build(
+                self.path_params
             )
         else:
             return f"{self.base_url}{self.path}"
 
 
-from furl import furl
-from typing import Dict, List, Any
-
-
-def build_url_with_path_params(base_url: str, path: str, path_params: Dict[str, str]):
-    url = furl(base_url)
-    url /= path.format(**path_params)
-    return url.url
-
-
 def auth_zero(request: Request):
     request.headers["apiKey"] = request.api_key
 
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+import requests
+from pydantic import BaseModel
+from codespeak.public.rest_requests.request import Request
+
+CacheKey = Tuple[str, str, str, str]
+
+
+class ResponseCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # stale entries the server confirmed with a 304, served without a new body
+    revalidations: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class CacheEntry:
+    def __init__(self, content: bytes, etag: str | None, expires_at: float) -> None:
+        self.content = content
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """LRU cache of get responses with a ttl, bounded by entry count and total body size"""
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self.stats = ResponseCacheStats()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(request: Request, url: str) -> CacheKey:
+        # the api key lives in the headers, so responses are never shared across keys
+        return (
+            request.api,
+            url,
+            json.dumps(request.query_params or {}, sort_keys=True, default=str),
+            json.dumps(request.headers, sort_keys=True, default=str),
+        )
+
+    def fetch(
+        self,
+        request: Request,
+        url: str,
+        send: Callable[[Dict[str, Any]], requests.Response],
+    ) -> Any:
+        """json-decoded content for the request, from the cache when fresh. send makes the request with the given headers."""
+        key = self.key(request, url)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                if entry.expires_at > time.monotonic():
+                    self.stats.hits += 1
+                    # decoded per hit, so callers can't mutate what's cached
+                    return json.loads(entry.content)
+
+        headers = dict(request.headers)
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        response = send(headers)
+        if response.status_code == 304 and entry is not None:
+            with self.lock:
+                entry.expires_at = time.monotonic() + self.ttl
+                self.stats.revalidations += 1
+            return json.loads(entry.content)
+        response.raise_for_status()
+        with self.lock:
+            self.stats.misses += 1
+            if is_storable(response):
+                self.store(
+                    key,
+                    CacheEntry(
+                        content=response.content,
+                        etag=response.headers.get("ETag"),
+                        expires_at=time.monotonic() + self.ttl,
+                    ),
+                )
+        return response.json()
+
+    def store(self, key: CacheKey, entry: CacheEntry):
+        if len(entry.content) > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.stats.bytes -= len(previous.content)
+        self.entries[key] = entry
+        self.stats.bytes += len(entry.content)
+        while len(self.entries) > self.max_entries or self.stats.bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.stats.bytes -= len(evicted.content)
+            self.stats.evictions += 1
+        self.stats.entries = len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+
+def is_storable(response: requests.Response) -> bool:
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    return response.status_code == 200 and "no-store" not in cache_control
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _response_cache
+
+
+def enable_response_cache(
+    ttl: float = 60, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+):
+    """Turns on caching for codespeak.get. Responses are reused for ttl seconds, then revalidated with their ETag if they had one."""
+    global _response_cache
+    _response_cache = ResponseCache(
+        ttl=ttl, max_entries=max_entries, max_bytes=max_bytes
+    )
+
+
+def disable_response_cache():
+    global _response_cache
+    _response_cache = None
+
+
+def response_cache_stats() -> ResponseCacheStats | None:
+    if _response_cache is None:
+        return None
+    with _response_cache.lock:
+        return _response_cache.stats.copy()
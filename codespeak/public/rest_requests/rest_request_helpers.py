@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Tuple
+from weakref import WeakKeyDictionary, WeakSet, finalize
+import requests
+from requests.adapters import HTTPAdapter
+from codespeak.apis.api_metadata import api_metadatas
+
+if TYPE_CHECKING:
+    import httpx
+
+# connections kept alive per api, per thread
+pool_maxsize = 10
+# open connections per api for the async helpers, per event loop
+async_max_connections = 100
+# of those, how many are kept alive between bursts. None keeps them all, so a fan out doesn't reconnect every time
+async_max_keepalive_connections: int | None = None
+
+# bumped by close_sessions so every thread knows to drop its closed sessions
+_generation = 0
+
+
+def _close_all(sessions: Dict[str, requests.Session]):
+    for session in sessions.values():
+        session.close()
+
+
+class ThreadSessions:
+    """One thread's session per api. Only its thread-local holds it, so its sessions are closed when the thread exits."""
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.sessions: Dict[str, requests.Session] = {}
+        finalize(self, _close_all, self.sessions)
+
+
+# requests.Session isn't thread safe, so each thread gets its own session per api
+_local = threading.local()
+# held weakly, so close_sessions can reach every live thread's sessions without keeping dead ones open
+_thread_sessions: WeakSet[ThreadSessions] = WeakSet()
+_thread_sessions_lock = threading.Lock()
+
+
+# httpx connections belong to the event loop they were opened on, so async clients are per loop
+_async_clients: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str, "httpx.AsyncClient"]
+] = WeakKeyDictionary()
+
+
+def configure_sessions(
+    pool_size: int | None = None,
+    max_async_connections: int | None = None,
+    max_async_keepalive_connections: int | None = None,
+):
+    """Sets how many connections each api session keeps alive, and how many each async client may open and keep alive. Applies to sessions and clients created from now on."""
+    global pool_maxsize, async_max_connections, async_max_keepalive_connections
+    if pool_size is not None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        pool_maxsize = pool_size
+    if max_async_connections is not None:
+        if max_async_connections < 1:
+            raise ValueError("max_async_connections must be at least 1")
+        async_max_connections = max_async_connections
+    if max_async_keepalive_connections is not None:
+        if max_async_keepalive_connections < 0:
+            raise ValueError("max_async_keepalive_connections can't be negative")
+        async_max_keepalive_connections = max_async_keepalive_connections
+
+
+def get_session(api: str) -> requests.Session:
+    """The pooled keep-alive session for an api on the current thread"""
+    thread_sessions: ThreadSessions | None = getattr(_local, "thread_sessions", None)
+    if thread_sessions is None or thread_sessions.generation != _generation:
+        thread_sessions = ThreadSessions(_generation)
+        _local.thread_sessions = thread_sessions
+        with _thread_sessions_lock:
+            _thread_sessions.add(thread_sessions)
+    session = thread_sessions.sessions.get(api)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        thread_sessions.sessions[api] = session
+    return session
+
+
+def close_sessions():
+    """Closes every api session on every thread"""
+    global _generation
+    with _thread_sessions_lock:
+        for thread_sessions in list(_thread_sessions):
+            _close_all(thread_sessions.sessions)
+        _thread_sessions.clear()
+        _generation += 1
+
+
+def get_async_client(api: str) -> "httpx.AsyncClient":
+    """The pooled async client for an api on the running event loop"""
+    # imported here so sync-only users never load httpx
+    import httpx
+
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=async_max_connections,
+                max_keepalive_connections=async_max_connections
+                if async_max_keepalive_connections is None
+                else async_max_keepalive_connections,
+            )
+        )
+        clients[api] = client
+    return client
+
+
+async def close_async_clients():
+    """Closes the async clients for the running event loop"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+class RateLimiter:
+    """Spaces out calls so they never go faster than requests_per_second, across threads"""
+
+    def __init__(self, requests_per_second: float) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.interval = 1 / requests_per_second
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            scheduled = max(now, self.next_time)
+            self.next_time = scheduled + self.interval
+        if scheduled > now:
+            time.sleep(scheduled - now)
+
+
+_rate_limiters: Dict[Tuple[str, float], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api: str) -> RateLimiter | None:
+    """The shared rate limiter for an api, or None if its metadata doesn't set requests_per_second"""
+    requests_per_second = api_metadatas[api].get("requests_per_second")
+    if requests_per_second is None:
+        return None
+    # keyed on the rate too, so changing the metadata takes effect
+    key = (api, requests_per_second)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(requests_per_second)
+        return _rate_limiters[key]
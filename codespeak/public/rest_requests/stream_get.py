@@ -0,0 +1,125 @@
+import codecs
+import json
+from typing import Any, Dict, Iterator
+import requests
+from codespeak.public.rest_requests.request import Request
+from codespeak.public.rest_requests.rest_request_helpers import get_session
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+_delimiters = _whitespace + ",]"
+
+
+def stream_get(
+    api: str,
+    path: str,
+    path_params: Dict[str, Any] | None = None,
+    query_params: Dict[str, Any] | None = None,
+    headers: Dict[str, Any] = {},
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Any]:
+    """
+    Makes a get request to an api whose response is a json array, and yields its items as they arrive instead of buffering the whole body. No api keys required.
+
+    Args:
+        api (str): The name of the api to use.
+        path (str): The openapi path for the operation.
+        path_params (Dict[str, str], optional): The path parameters to use in the operation. Defaults to None.
+        query_params (Dict[str, str], optional): The query parameters to use in the operation. Defaults to None.
+        headers (Dict[str, str], optional): The headers to use in the operation. Defaults to {}.
+        chunk_size (int, optional): How many bytes to read from the response at a time. Defaults to 64kb.
+
+    Returns:
+        type: an iterator over the json-decoded items of the response array.
+    """
+    request = Request(
+        api=api,
+        path=path,
+        api_key=None,
+        path_params=path_params,
+        query_params=query_params,
+        data=None,
+        json_=None,
+        cookies=None,
+        headers=headers,
+    )
+    request.authenticate()
+    response = get_session(request.api).get(
+        url=request.make_url(),
+        params=request.query_params,
+        headers=request.headers,
+        stream=True,
+    )
+    with response:
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise e
+        yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+
+
+def iter_json_array(chunks: Iterator[bytes]) -> Iterator[Any]:
+    """Incrementally decodes a json array from chunks of utf-8 bytes, holding at most one item plus one chunk in memory"""
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        return True
+
+    def skip_whitespace() -> bool:
+        """Moves to the next significant character, False at the end of the body"""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _whitespace:
+                position += 1
+            if position < len(buffer):
+                return True
+            if not read_more():
+                return False
+
+    if not skip_whitespace() or buffer[position] != "[":
+        raise ValueError("Expected the response body to be a json array")
+    position += 1
+    expect_item = True
+    has_items = False
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Response body ended in the middle of a json array")
+        if buffer[position] == "]":
+            if expect_item and has_items:
+                raise ValueError("Unexpected ',' before the end of the json array")
+            return
+        if not expect_item:
+            if buffer[position] != ",":
+                raise ValueError("Expected ',' between items of the json array")
+            position += 1
+            expect_item = True
+            continue
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise
+                continue
+            # a number cut off by the end of a chunk decodes early ("4." as 4), so an item must be followed by a delimiter
+            is_cut_off = end == len(buffer) or buffer[end] not in _delimiters
+            if is_cut_off and read_more():
+                continue
+            break
+        position = end
+        expect_item = False
+        has_items = True
+        yield item
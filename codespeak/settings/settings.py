@@ -16,17 +16,24 @@ class Settings(BaseModel):
     api_keys: ApiKeys = {}
     abspath_to_project_root: str | None = None
     current_api_identifier: api_identifier | None = None
+    use_inference_cache: bool = True
+    inference_cache_max_bytes: int = 64 * 1024 * 1024
 
     @staticmethod
     def from_env():
+        # CODESPEAK_NO_INFERENCE_CACHE=1 bypasses the on-disk inference cache for a run
+        use_inference_cache = os.getenv("CODESPEAK_NO_INFERENCE_CACHE", "0") in ("", "0")
         env = os.getenv("ENV")
         if env is not None:
             env = env.lower()
             if env in [e.value for e in Environment]:
                 return Settings(
                     environment=Environment(env),
+                    use_inference_cache=use_inference_cache,
                 )
-        return Settings(environment=Environment.DEV)
+        return Settings(
+            environment=Environment.DEV, use_inference_cache=use_inference_cache
+        )
 
 
 _settings = Settings.from_env()
@@ -79,6 +86,25 @@ def set_interactive_mode(should_use_interactive_mode: bool):
     _settings.is_interactive_mode = should_use_interactive_mode
 
 
+def get_use_inference_cache() -> bool:
+    return _settings.use_inference_cache
+
+
+def set_use_inference_cache(use_inference_cache: bool):
+    """Inferences for unchanged functions are reused from _codespeak/inferences in the project root. Turn off to always ask the service."""
+    _settings.use_inference_cache = use_inference_cache
+
+
+def get_inference_cache_max_bytes() -> int:
+    return _settings.inference_cache_max_bytes
+
+
+def set_inference_cache_max_bytes(max_bytes: int):
+    if max_bytes < 0:
+        raise ValueError("max_bytes must not be negative")
+    _settings.inference_cache_max_bytes = max_bytes
+
+
 def set_environment(env: Environment | str):
     if isinstance(env, Environment):
         _settings.environment = env
@@ -6,36 +6,62 @@ from codespeak.type_definitions.free_modules import FREE_MODULES
 import os
 import types
 from codespeak.type_definitions.type_definition import TypeDefinition
-from codespeak.type_definitions.types.local_class import LocalClass
+from codespeak.type_definitions.type_node import TypeNode
 from codespeak.helpers.derive_module_qualname_for_object import (
     derive_module_qualname_for_object,
 )
-from codespeak.type_definitions.types.installed_class import InstalledClass
-from codespeak.type_definitions.types.builtin import Builtin
-from codespeak.type_definitions.types.none import NoneDef
-from codespeak.type_definitions.types.typing_type import TypingType
-from codespeak.type_definitions.types.union_type import UnionType
-import pkg_resources
+from codespeak.helpers.parsed_source_file import (
+    try_get_parsed_source_file_for_object,
+)
+from importlib import metadata
+from functools import lru_cache
+from codespeak.settings import settings
+
+# shared types show up across many writable functions, so classifications are memoized
+CLASSIFICATION_CACHE_SIZE = 4096
 
 
-def to_union_type(definition: Any) -> UnionType:
+def to_union_type(definition: Any) -> TypeNode:
     args = get_args(definition)
-    _types = []
-    for _type in args:
-        _types.append(from_any(_type))
-    return UnionType(args=_types, _def=definition, origin=get_origin(definition))
+    return TypeNode(
+        type="UnionType",
+        module="types",
+        qualname="UnionType",
+        args=tuple(node_from_any(_type) for _type in args),
+        origin=get_origin(definition),
+    )
 
 
 def is_builtin_type(module_name: str):
     return module_name == "builtins"
 
 
+_installed_packages: frozenset[str] | None = None
+
+
+def get_installed_packages() -> frozenset[str]:
+    """Top-level module and distribution names for everything installed, built once on first use"""
+    global _installed_packages
+    if _installed_packages is None:
+        names = set()
+        for module_name, distributions in metadata.packages_distributions().items():
+            names.add(module_name)
+            names.update(distribution.lower() for distribution in distributions)
+        _installed_packages = frozenset(names)
+    return _installed_packages
+
+
+def invalidate_installed_packages():
+    """Call after installing or removing packages in a running process"""
+    global _installed_packages
+    _installed_packages = None
+
+
 def is_installed_package_type(module_name: str):
     if module_name in FREE_MODULES:
         return True
     else:
-        installed_packages = [pkg.key for pkg in pkg_resources.working_set]
-        return module_name.split(".")[0] in installed_packages
+        return module_name.split(".")[0] in get_installed_packages()
 
 
 def is_local_class(definition: type) -> bool:
@@ -53,18 +79,14 @@ def is_local_class(definition: type) -> bool:
     return True
 
 
-def to_typing_type(definition: Any) -> TypingType:
+def to_typing_type(definition: Any) -> TypeNode:
     args = get_args(definition)
-    defs = []
-    for _type in args:
-        defs.append(from_any(_type))
-
-    return TypingType(
+    return TypeNode(
+        type="TypingType",
         qualname=definition.__qualname__,
         module=definition.__module__,
         origin=get_origin(definition),
-        args=defs,
-        _def=definition,
+        args=tuple(node_from_any(_type) for _type in args),
     )
 
 
@@ -87,11 +109,56 @@ def from_any_tuple(tup: Tuple[Any]) -> List[TypeDefinition]:
     return [from_any(_def) for _def in tup]
 
 
+def nodes_from_tuple(tup: Tuple[Any]) -> Tuple[TypeNode, ...]:
+    return tuple(node_from_any(_def) for _def in tup)
+
+
+def is_hashable(definition: Any) -> bool:
+    try:
+        hash(definition)
+    except TypeError:
+        return False
+    return True
+
+
 def from_any(
     definition: Any,
 ) -> TypeDefinition:
+    """
+    Classifies definition into a TypeDefinition.
+
+    Classifications are cached, so the same instance (and the definitions nested in it) is returned to every caller.
+    Don't modify it, use .copy(deep=True) for a definition you need to change.
+    """
+    return node_from_any(definition).to_type_definition()
+
+
+def node_from_any(definition: Any) -> TypeNode:
+    if not is_hashable(definition):
+        return node_from_any_uncached(definition)
+    return node_from_any_cached(definition, settings.get_abspath_to_project_root())
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def node_from_any_cached(definition: Any, project_root: str) -> TypeNode:
+    # local class modules are derived from the project root, so it's part of the key
+    return node_from_any_uncached(definition)
+
+
+def classification_cache_info():
+    """Hits, misses, maxsize and current size of the classification cache"""
+    return node_from_any_cached.cache_info()
+
+
+def clear_classification_cache():
+    node_from_any_cached.cache_clear()
+
+
+def node_from_any_uncached(
+    definition: Any,
+) -> TypeNode:
     if definition is None:
-        return NoneDef()
+        return TypeNode(type="NoneDef", module="None", qualname="None")
     if not hasattr(definition, "__module__"):
         raise Exception("expected a module on the type")
     if get_origin(definition) is types.UnionType:
@@ -105,28 +172,28 @@ def from_any(
         if may_have_args(definition.__qualname__):
             return to_typing_type(definition)
         else:
-            return Builtin(
+            return TypeNode(
+                type="Builtin",
                 module=definition.__module__,
                 qualname=definition.__qualname__,
-                _def=definition,
             )
     elif inspect.isclass(definition):
         if is_local_class(definition):
-            return LocalClass(
+            return TypeNode(
+                type="LocalClass",
                 qualname=definition.__qualname__,
                 module=derive_module_qualname_for_object(
                     definition
                 ),  # definition.__module__,
-                source_code=inspect.getsource(definition),
-                bases=from_any_tuple(definition.__bases__),
+                source_code=class_source(definition),
+                bases=nodes_from_tuple(definition.__bases__),
                 type_hints=collect_type_hints(definition),
-                _def=definition,
             )
         else:
-            return InstalledClass(
+            return TypeNode(
+                type="InstalledClass",
                 qualname=definition.__qualname__,
                 module=definition.__module__,
-                _def=definition,
             )
     elif inspect.isfunction(definition):
         # TODO
@@ -140,11 +207,19 @@ def from_any(
         raise Exception("unsure how to handle definition: ", definition)
 
 
+def class_source(_class: type) -> str:
+    # inspect.getsource parses the whole module for every class, the parsed file is shared
+    parsed = try_get_parsed_source_file_for_object(_class)
+    if parsed is not None:
+        try:
+            return parsed.class_source(_class.__qualname__)
+        except ValueError:
+            # defined somewhere the qualname can't find statically, like under an if
+            pass
+    return inspect.getsource(_class)
+
+
 # technically get_type_hints can work on some installed types but we aren't using it for that atm
-def collect_type_hints(_class: type) -> Dict[str, TypeDefinition]:
+def collect_type_hints(_class: type) -> Tuple[Tuple[str, TypeNode], ...]:
     hints = get_type_hints(_class, include_extras=False)
-    definitions = {}
-    for name, _def in hints.items():
-        typed_def = from_any(_def)
-        definitions[name] = typed_def
-    return definitions
+    return tuple((name, node_from_any(_def)) for name, _def in hints.items())
@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
@@ -15,10 +15,17 @@ class ImportDefinition(BaseModel):
     module: str
     type: Literal["ImportDefinition"] = "ImportDefinition"
 
+    class Config:
+        # instances are interned and shared, so they can't change, and aren't copied into models that hold them
+        allow_mutation = False
+        copy_on_model_validation = "none"
+
     def __hash__(self):
         return hash((self.module, self.qualname))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, ImportDefinition):
             return (self.module, self.qualname) == (other.module, other.qualname)
         return False
@@ -33,7 +40,19 @@ class ImportDefinition(BaseModel):
 
     @staticmethod
     def from_type_definition(type_definition: TypeDefinition) -> "ImportDefinition":
-        return ImportDefinition(
-            qualname=type_definition.qualname,
-            module=type_definition.module,
+        return intern_import_definition(
+            module=type_definition.module, qualname=type_definition.qualname
         )
+
+
+# one shared instance per import path, bounded by the number of types a project uses
+_import_definitions: Dict[Tuple[str, str], ImportDefinition] = {}
+
+
+def intern_import_definition(module: str, qualname: str) -> ImportDefinition:
+    key = (module, qualname)
+    definition = _import_definitions.get(key)
+    if definition is None:
+        definition = ImportDefinition(qualname=qualname, module=module)
+        definition = _import_definitions.setdefault(key, definition)
+    return definition
@@ -1,10 +1,13 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from abc import ABC, abstractmethod
 from typing import Literal
 
+# fields the structural key is computed from, reassigning one recomputes it
+STRUCTURAL_FIELDS = ("module", "qualname", "args")
+
 
 class TypeDefinition(ABC, BaseModel):
     qualname: str
@@ -12,20 +15,36 @@ class TypeDefinition(ABC, BaseModel):
     args: List["TypeDefinition"] = []
     type: Literal["TypeDefinition"] = "TypeDefinition"
     _def: Any
+    # (module, qualname, arg import paths), what hashing and equality compare
+    _structural_key: Tuple | None = PrivateAttr(default=None)
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._structural_key = self.compute_structural_key()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in STRUCTURAL_FIELDS:
+            self._structural_key = None
+
+    def structural_key(self) -> Tuple:
+        if self._structural_key is None:
+            self._structural_key = self.compute_structural_key()
+        return self._structural_key
+
+    def compute_structural_key(self) -> Tuple:
+        return (
+            self.module,
+            self.qualname,
+            tuple(arg.import_path() for arg in self.args),
+        )
 
     def __hash__(self):
-        arg_paths = [arg.import_path() for arg in self.args]
-        return hash((self.module, self.qualname, str(arg_paths)))
+        return hash(self.structural_key())
 
     def __eq__(self, other):
         if isinstance(other, TypeDefinition):
-            self_arg_paths = [arg.import_path() for arg in self.args]
-            other_arg_paths = [arg.import_path() for arg in other.args]
-            return (self.module, self.qualname, str(self_arg_paths)) == (
-                other.module,
-                other.qualname,
-                str(other_arg_paths),
-            )
+            return self.structural_key() == other.structural_key()
         return False
 
     def __lt__(self, other):
@@ -56,9 +75,6 @@ class TypeDefinition(ABC, BaseModel):
     def custom_types(self) -> Dict:
         pass
 
-    def reference_nested_custom_types(self) -> List["TypeDefinition"]:
-        return []
-
     def is_a_union_type(self) -> bool:
         return self.type == "UnionType" or (
             self.type == "TypingType" and self.qualname.lower() == "union"
@@ -0,0 +1,83 @@
+from typing import Dict, Iterable, List
+
+from codespeak.type_definitions.type_definition import TypeDefinition
+
+# types that get their own entry in the custom types map, and are referenced everywhere else
+CUSTOM_TYPES = ("LocalClass", "InstalledClass")
+# types whose args can hold custom types
+CONTAINER_TYPES = ("TypingType", "UnionType")
+
+
+class TypeGraph:
+    """
+    The custom types reachable from a set of type definitions, collected in one walk.
+
+    Each custom type is visited once, deduped by import path, which also stops at classes that refer back to one already visited. The definitions themselves are never modified.
+    """
+
+    def __init__(self, definitions: Iterable[TypeDefinition] = ()) -> None:
+        # import path -> annotation, with nested custom types as refs
+        self.custom_types: Dict[str, Dict] = {}
+        # import path -> reference form of each definition added
+        self.references: Dict[str, Dict | str] = {}
+        self.visited: Dict[str, TypeDefinition] = {}
+        for definition in definitions:
+            self.add(definition)
+
+    def add(self, definition: TypeDefinition):
+        self.references[definition.import_path()] = reference_form(definition)
+        if definition.type in CUSTOM_TYPES:
+            self.visit([definition])
+        elif definition.type in CONTAINER_TYPES:
+            self.visit(custom_types_in_args(definition.args))
+        else:
+            self.custom_types.update(definition.custom_types())
+
+    def visit(self, definitions: List[TypeDefinition]):
+        # iterative depth first walk, so deep hierarchies don't hit the recursion limit
+        stack = list(reversed(definitions))
+        while stack:
+            definition = stack.pop()
+            import_path = definition.import_path()
+            if import_path in self.visited:
+                continue
+            self.visited[import_path] = definition
+            if definition.type == "LocalClass":
+                self.custom_types.update(definition.annotate_with_references())
+                stack.extend(reversed(nested_custom_types(definition)))
+            else:
+                self.custom_types.update(definition.annotate())
+
+
+def ref(definition: TypeDefinition) -> str:
+    return "$ref: complex_types/" + definition.import_path()
+
+
+def reference_form(definition: TypeDefinition) -> Dict | str:
+    """How a definition is annotated inside a local class, with custom types replaced by refs"""
+    if definition.type in CUSTOM_TYPES:
+        return ref(definition)
+    if definition.type in CONTAINER_TYPES and definition.args:
+        return {
+            definition.import_path(): [reference_form(arg) for arg in definition.args]
+        }
+    return definition.annotate_in_local_class()
+
+
+def nested_custom_types(local_class: TypeDefinition) -> List[TypeDefinition]:
+    attributes = [*local_class.type_hints.values(), *local_class.bases]
+    nested = [_def for _def in attributes if _def.type in CUSTOM_TYPES]
+    for _def in attributes:
+        if _def.type in CONTAINER_TYPES:
+            nested.extend(custom_types_in_args(_def.args))
+    return nested
+
+
+def custom_types_in_args(args: List[TypeDefinition]) -> List[TypeDefinition]:
+    found = []
+    for _def in args:
+        if _def.type in CONTAINER_TYPES:
+            found.extend(custom_types_in_args(_def.args))
+        elif _def.type in CUSTOM_TYPES:
+            found.append(_def)
+    return found
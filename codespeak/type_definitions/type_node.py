@@ -0,0 +1,97 @@
+from typing import Any, Tuple
+
+from codespeak.type_definitions.type_definition import TypeDefinition
+from codespeak.type_definitions.types.builtin import Builtin
+from codespeak.type_definitions.types.installed_class import InstalledClass
+from codespeak.type_definitions.types.local_class import LocalClass
+from codespeak.type_definitions.types.none import NoneDef
+from codespeak.type_definitions.types.typing_type import TypingType
+from codespeak.type_definitions.types.union_type import UnionType
+
+
+class TypeNode:
+    """
+    Compact, immutable result of classifying a type, what the classification cache holds.
+
+    The pydantic TypeDefinition for a node is built without validation the first time it's asked for, then reused.
+    """
+
+    __slots__ = (
+        "type",
+        "module",
+        "qualname",
+        "args",
+        "origin",
+        "source_code",
+        "bases",
+        "type_hints",
+        "definition",
+    )
+
+    def __init__(
+        self,
+        type: str,
+        module: str,
+        qualname: str,
+        args: Tuple["TypeNode", ...] = (),
+        origin: Any = None,
+        source_code: str | None = None,
+        bases: Tuple["TypeNode", ...] = (),
+        type_hints: Tuple[Tuple[str, "TypeNode"], ...] = (),
+    ) -> None:
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "module", module)
+        object.__setattr__(self, "qualname", qualname)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "origin", origin)
+        object.__setattr__(self, "source_code", source_code)
+        object.__setattr__(self, "bases", bases)
+        object.__setattr__(self, "type_hints", type_hints)
+        object.__setattr__(self, "definition", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"TypeNode is immutable, can't set {name}")
+
+    def __repr__(self) -> str:
+        return f"TypeNode({self.type}, {self.module}.{self.qualname})"
+
+    def import_path(self) -> str:
+        return self.module + "." + self.qualname
+
+    def to_type_definition(self) -> TypeDefinition:
+        if self.definition is None:
+            object.__setattr__(self, "definition", build_type_definition(self))
+        return self.definition
+
+
+def build_type_definition(node: TypeNode) -> TypeDefinition:
+    # nodes are already well formed, so validation (and the copies it makes of nested models) is skipped
+    if node.type == "NoneDef":
+        return NoneDef.construct()
+    if node.type == "Builtin":
+        return Builtin.construct(module=node.module, qualname=node.qualname)
+    if node.type == "InstalledClass":
+        return InstalledClass.construct(module=node.module, qualname=node.qualname)
+    if node.type == "TypingType":
+        return TypingType.construct(
+            module=node.module,
+            qualname=node.qualname,
+            origin=node.origin,
+            args=[arg.to_type_definition() for arg in node.args],
+        )
+    if node.type == "UnionType":
+        return UnionType.construct(
+            origin=node.origin,
+            args=[arg.to_type_definition() for arg in node.args],
+        )
+    if node.type == "LocalClass":
+        return LocalClass.construct(
+            module=node.module,
+            qualname=node.qualname,
+            source_code=node.source_code,
+            bases=[base.to_type_definition() for base in node.bases],
+            type_hints={
+                name: hint.to_type_definition() for name, hint in node.type_hints
+            },
+        )
+    raise Exception("unsure how to build a type definition for node: ", node)
@@ -4,9 +4,7 @@ from typing import Any, Dict, List, Tuple
 from typing import Literal
 from codespeak.type_definitions.types.generic import Generic
 from codespeak.type_definitions.type_definition import TypeDefinition
-from codespeak.type_definitions.utils.swap_custom_types import (
-    recursively_swap_custom_types_for_references,
-)
+from codespeak.type_definitions.type_graph import TypeGraph
 
 
 class TypingType(TypeDefinition):
@@ -45,14 +43,5 @@ class TypingType(TypeDefinition):
                 ]
             }
 
-    def reference_nested_custom_types(self) -> List[TypeDefinition]:
-        args = self.args
-        types_replaced, self.args = recursively_swap_custom_types_for_references(args)
-        return types_replaced
-
     def custom_types(self) -> Dict:
-        types_replaced = self.reference_nested_custom_types()
-        annotxn = {}
-        for _type in types_replaced:
-            annotxn.update(_type.custom_types())
-        return annotxn
+        return TypeGraph([self]).custom_types
@@ -0,0 +1,211 @@
+import sys
+from typing import List, Set
+import pytest
+from codespeak.decorate.regenerate import regenerate
+from codespeak.decorate.write_all import write_all
+from codespeak.function.dependency_index import DependencyIndex, function_key
+from codespeak.function.function_metadata import (
+    load_module_metadata,
+    metadata_path,
+    save_module_metadata,
+)
+from codespeak.inference import codespeak_service
+from codespeak.settings import settings
+
+MODULE_NAME = "shapes"
+
+POINT = '''
+class Point:
+    x: int
+    y: int
+'''
+
+LABEL = '''
+class Label:
+    text: str
+'''
+
+FUNCTIONS = '''
+
+@writable
+def shift(point: Point, dx: int) -> Point:
+    """moves point right by dx"""
+    pass
+
+
+@writable
+def shout(label: Label) -> str:
+    """the text of label in capitals"""
+    pass
+
+
+@writable
+def double(n: int) -> int:
+    """twice n"""
+    pass
+'''
+
+GENERATED = {
+    "shift": '''def shift(point: Point, dx: int) -> Point:
+    """moves point right by dx"""
+    return point
+''',
+    "shout": '''def shout(label: Label) -> str:
+    """the text of label in capitals"""
+    return label.text.upper()
+''',
+    "double": '''def double(n: int) -> int:
+    """twice n"""
+    return n * 2
+''',
+}
+
+
+def module_source(point: str = POINT, label: str = LABEL) -> str:
+    return "from codespeak import writable\n\n" + point + "\n" + label + FUNCTIONS
+
+
+@pytest.fixture
+def failing() -> Set[str]:
+    """Names of the functions whose inference fails"""
+    return set()
+
+
+@pytest.fixture
+def inferred(monkeypatch, failing) -> List[str]:
+    """Names of the functions sent for inference, answered with GENERATED instead of the service"""
+    names: List[str] = []
+
+    async def make_inference(function_lite, api_identifier: str) -> str:
+        name = function_lite.declaration.name
+        names.append(name)
+        if name in failing:
+            raise ValueError("inference failed")
+        return "```python\n" + GENERATED[name] + "```"
+
+    monkeypatch.setattr(codespeak_service, "make_inference", make_inference)
+    return names
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, inferred):
+    """A project with the shapes module written once, as if from an earlier run"""
+    (tmp_path / "pyproject.toml").write_text("")
+    (tmp_path / "shapes.py").write_text(module_source())
+    monkeypatch.setattr(settings._settings, "abspath_to_project_root", str(tmp_path))
+    monkeypatch.setattr(settings._settings, "current_api_identifier", "harmonic")
+    monkeypatch.setattr(settings._settings, "use_inference_cache", False)
+    write_all(str(tmp_path / "shapes.py"))
+    inferred.clear()
+    # later steps run as a new process would, importing the written module
+    sys.modules.pop(MODULE_NAME, None)
+    yield tmp_path
+    sys.modules.pop(MODULE_NAME, None)
+
+
+def edit_module(project, point: str = POINT, label: str = LABEL):
+    path = project / "shapes.py"
+    source = path.read_text()
+    path.write_text(source.replace(POINT, point, 1).replace(LABEL, label, 1))
+
+
+def key(project, qualname: str):
+    return function_key(str(project / "shapes.py"), qualname)
+
+
+def test_dependencies_are_recorded(project):
+    metadata = load_module_metadata(str(project / "shapes.py"))
+    assert metadata is not None
+    assert metadata.functions["shift"].dependencies is not None
+    assert list(metadata.functions["shift"].dependencies) == ["shapes.Point"]
+    assert list(metadata.functions["shout"].dependencies) == ["shapes.Label"]
+    assert metadata.functions["double"].dependencies == {}
+
+
+def test_up_to_date_functions_are_not_reinferred(project, inferred):
+    index = DependencyIndex.from_metadata()
+    assert index.stale_functions() == set()
+    assert index.unverifiable_functions() == set()
+    assert regenerate(str(project / "shapes.py")) == []
+    assert inferred == []
+
+
+def test_changed_class_makes_only_its_dependents_stale(project):
+    edit_module(project, point=POINT + "    z: int\n")
+    index = DependencyIndex.from_metadata()
+    assert index.dependents_of("shapes.Point") == {key(project, "shift")}
+    assert index.stale_functions() == {key(project, "shift")}
+    assert index.unverifiable_functions() == set()
+
+
+def test_only_dependents_of_a_changed_class_are_reinferred(project, inferred):
+    edit_module(project, label=LABEL + "    language: str\n")
+    assert regenerate(str(project / "shapes.py")) == ["shapes.shout"]
+    assert inferred == ["shout"]
+    # written again from the changed class, so it's up to date
+    sys.modules.pop(MODULE_NAME, None)
+    inferred.clear()
+    assert regenerate(str(project / "shapes.py")) == []
+    assert inferred == []
+
+
+def test_stale_flag_is_kept_until_reinferred(project, inferred, failing):
+    edit_module(project, point=POINT + "    z: int\n")
+    failing.add("shift")
+    with pytest.raises(Exception):
+        regenerate(str(project / "shapes.py"))
+    metadata = load_module_metadata(str(project / "shapes.py"))
+    assert metadata is not None and metadata.functions["shift"].stale
+    # the class is back to what shift was inferred from, but it's still queued
+    edit_module(project, point=POINT)
+    failing.clear()
+    inferred.clear()
+    sys.modules.pop(MODULE_NAME, None)
+    assert regenerate(str(project / "shapes.py")) == ["shapes.shift"]
+    assert inferred == ["shift"]
+    metadata = load_module_metadata(str(project / "shapes.py"))
+    assert metadata is not None and not metadata.functions["shift"].stale
+
+
+def test_functions_without_recorded_dependencies_are_unverifiable(project, inferred):
+    path = metadata_path(str(project / "shapes.py"))
+    metadata = load_module_metadata(str(project / "shapes.py"))
+    assert metadata is not None
+    functions = {
+        qualname: function.copy(update={"dependencies": None})
+        for qualname, function in metadata.functions.items()
+    }
+    save_module_metadata(path, metadata.copy(update={"functions": functions}))
+    index = DependencyIndex.from_metadata()
+    assert index.unverifiable_functions() == {
+        key(project, "shift"),
+        key(project, "shout"),
+        key(project, "double"),
+    }
+    # checked by classifying instead, so only the function whose custom types changed is re-inferred
+    edit_module(project, point=POINT + "    z: int\n")
+    assert regenerate(str(project / "shapes.py")) == ["shapes.shift"]
+    assert inferred == ["shift"]
+
+
+def test_class_that_cant_be_located_makes_its_dependents_unverifiable(
+    project, inferred
+):
+    hidden_point = "\nif True:\n" + "".join(
+        "    " + line + "\n" for line in POINT.strip().splitlines()
+    )
+    edit_module(project, point=hidden_point)
+    index = DependencyIndex.from_metadata()
+    assert index.unverifiable_functions() == {key(project, "shift")}
+    assert index.stale_functions() == set()
+    # checked by classifying instead, and the class's source reads differently now
+    assert regenerate(str(project / "shapes.py")) == ["shapes.shift"]
+    assert inferred == ["shift"]
+    # still unverifiable, but its custom types match what it was last inferred from
+    sys.modules.pop(MODULE_NAME, None)
+    inferred.clear()
+    assert DependencyIndex.from_metadata().unverifiable_functions() == {
+        key(project, "shift")
+    }
+    assert regenerate(str(project / "shapes.py")) == []
+    assert inferred == []
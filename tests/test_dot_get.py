@@ -0,0 +1,89 @@
+from codespeak.public.dot_get import dot_get, dot_get_many
+
+DATA = {
+    "company": {"name": "Acme", "owner": {"name": "Ada"}, "website": None},
+    "items": [
+        {"id": 1, "tags": ["a", "b"]},
+        {"id": 2, "tags": []},
+        {"id": 3},
+    ],
+    "by_id": {"x": {"score": 10}, "y": {"score": 20}},
+    "matrix": [[1, 2], [3, 4]],
+    "0": "string key",
+}
+
+
+def test_nested_keys():
+    assert dot_get(DATA, "company.owner.name") == "Ada"
+    assert dot_get(DATA, "company") is DATA["company"]
+
+
+def test_nested_indices():
+    assert dot_get(DATA, "items.0.id") == 1
+    assert dot_get(DATA, "items.0.tags.1") == "b"
+    assert dot_get(DATA, "matrix.1.0") == 3
+    assert dot_get(DATA, "items.-1.id") == 3
+
+
+def test_integer_keys_look_up_dicts_by_string():
+    assert dot_get(DATA, "0") == "string key"
+    assert dot_get({"a": {"1": "one"}}, "a.1") == "one"
+
+
+def test_wildcard_over_list():
+    assert dot_get(DATA, "items.*.id") == [1, 2, 3]
+    assert dot_get(DATA, "items.*.tags.0") == ["a", None, None]
+    assert dot_get(DATA, "matrix.*") == [[1, 2], [3, 4]]
+
+
+def test_wildcard_over_dict():
+    assert dot_get(DATA, "by_id.*.score") == [10, 20]
+    assert dot_get(DATA, "by_id.*") == [{"score": 10}, {"score": 20}]
+
+
+def test_nested_wildcards():
+    assert dot_get(DATA, "matrix.*.*") == [[1, 2], [3, 4]]
+    assert dot_get(DATA, "items.*.tags.*") == [["a", "b"], [], None]
+
+
+def test_wildcard_fills_missing_with_default():
+    assert dot_get(DATA, "items.*.tags.0", "none") == ["a", "none", "none"]
+
+
+def test_wildcard_over_missing_or_scalar_returns_default():
+    assert dot_get(DATA, "missing.*.id", []) == []
+    assert dot_get(DATA, "company.name.*") is None
+
+
+def test_missing_keys():
+    assert dot_get(DATA, "company.ceo") is None
+    assert dot_get(DATA, "company.ceo.name", "unknown") == "unknown"
+    assert dot_get(DATA, "missing") is None
+    assert dot_get({}, "a.b.c", 0) == 0
+
+
+def test_none_values_return_default():
+    assert dot_get(DATA, "company.website", "n/a") == "n/a"
+    assert dot_get(DATA, "company.website.host", "n/a") == "n/a"
+    assert dot_get(None, "a", "n/a") == "n/a"
+
+
+def test_out_of_range_indices():
+    assert dot_get(DATA, "items.3.id") is None
+    assert dot_get(DATA, "items.-4.id", "gone") == "gone"
+    assert dot_get(DATA, "items.1.tags.0", "empty") == "empty"
+
+
+def test_index_into_scalar_returns_default():
+    assert dot_get(DATA, "company.name.0", "x") == "x"
+    assert dot_get(DATA, "items.0.id.name", "x") == "x"
+
+
+def test_non_integer_key_into_list_returns_default():
+    assert dot_get(DATA, "items.first.id", "x") == "x"
+
+
+def test_dot_get_many():
+    records = DATA["items"]
+    assert dot_get_many(records, "id") == [1, 2, 3]
+    assert dot_get_many(records, "tags.0", "-") == ["a", "-", "-"]
@@ -0,0 +1,44 @@
+import os
+import pytest
+from codespeak.frame import Frame
+from codespeak.settings import settings
+
+
+class Company:
+    name: str
+
+
+class Person:
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.setattr(settings._settings, "abspath_to_project_root", root)
+
+
+def test_parents_are_held_by_reference():
+    parent = Frame()
+    child = Frame(parents=[parent])
+    assert child.parents[0] is parent
+
+
+def test_custom_types_snapshot_is_reused_until_something_changes():
+    parent = Frame()
+    parent.add_classes(Company)
+    child = Frame(parents=[parent])
+    assert child.custom_types() is child.custom_types()
+
+
+def test_changing_a_parent_rebuilds_the_child_snapshot():
+    parent = Frame()
+    parent.add_classes(Company)
+    child = Frame(parents=[parent])
+    assert "tests.test_frame.Company" in child.custom_types()
+    # same number of definitions, so only the version counter can tell
+    parent.type_definitions.clear()
+    parent.add_classes(Person)
+    custom_types = child.custom_types()
+    assert "tests.test_frame.Person" in custom_types
+    assert "tests.test_frame.Company" not in custom_types
@@ -0,0 +1,92 @@
+import random
+import string
+import pytest
+from codespeak.public.rest_requests.path_template import (
+    PathTemplate,
+    build_url_with_path_params,
+    compile_path_template,
+)
+
+BASE_URLS = [
+    "https://api.harmonic.ai",
+    "https://api.harmonic.ai/",
+    "https://h.ai/v1",
+    "https://h.ai/v1/",
+    "https://h.ai?q=1",
+    "http://h.ai:8080/a b",
+    "https://h.ai/%41x",
+]
+PATHS = [
+    "/companies/{id}",
+    "companies/{id}",
+    "/x/{id}/y/{other}",
+    "/x/{id}.json",
+    "//x/{id}/",
+    "/x-{id}-{other}",
+    "/{id}",
+    "/x/{id:05d}",
+    "/x/{{lit}}/{id}",
+    "/p/{0}",
+    "/p/{id!r}",
+    "/é/{id}",
+    "/a%20b/{id}",
+]
+ALPHABET = string.ascii_letters + string.digits + " /%?#&=+;:@!$'()*,~-._éü中\\\"<>[]{}^|`"
+CASES_PER_PAIR = 100
+
+
+def outcome(build, *args):
+    """The url, or the type of the error raised, so failures are compared too"""
+    try:
+        return build(*args)
+    except Exception as e:
+        return type(e)
+
+
+def random_path_params(rng: random.Random, path: str):
+    if ":05d" in path:
+        return {"id": rng.randint(0, 10**7), "other": 1}
+    params = {
+        name: "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 6)))
+        for name in ("id", "other")
+    }
+    if rng.random() < 0.3:
+        params["id"] = rng.randint(-5, 10**6)
+    return params
+
+
+@pytest.mark.parametrize("base_url", BASE_URLS)
+@pytest.mark.parametrize("path", PATHS)
+def test_matches_furl(base_url: str, path: str):
+    rng = random.Random(f"{base_url} {path}")
+    template = PathTemplate(base_url, path)
+    for _ in range(CASES_PER_PAIR):
+        path_params = random_path_params(rng, path)
+        assert outcome(template.build, path_params) == outcome(
+            build_url_with_path_params, base_url, path, path_params
+        ), path_params
+
+
+@pytest.mark.parametrize("value", ["a/b", "50%", "", ".", ".."])
+def test_special_values_fall_back_to_furl(value: str):
+    base_url, path = "https://h.ai/v1", "/x/{id}"
+    assert PathTemplate(base_url, path).build({"id": value}) == build_url_with_path_params(
+        base_url, path, {"id": value}
+    )
+
+
+def test_positional_and_converted_fields_are_not_compiled():
+    assert PathTemplate("https://h.ai", "/p/{0}").literals is None
+    assert PathTemplate("https://h.ai", "/p/{id!r}").literals is None
+    assert PathTemplate("https://h.ai", "/p/{id}").literals is not None
+
+
+def test_missing_path_param_raises_key_error():
+    with pytest.raises(KeyError):
+        PathTemplate("https://h.ai", "/x/{id}/{other}").build({"id": 1})
+
+
+def test_compiled_templates_are_shared():
+    assert compile_path_template("https://h.ai", "/x/{id}") is compile_path_template(
+        "https://h.ai", "/x/{id}"
+    )